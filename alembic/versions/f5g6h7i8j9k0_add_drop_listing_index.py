@@ -0,0 +1,35 @@
+"""Add composite listing index on dropped_domains
+
+Revision ID: f5g6h7i8j9k0
+Revises: 2326c42ca838
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5g6h7i8j9k0'
+down_revision: Union[str, None] = '2326c42ca838'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the /domains and /deleted-domains ORDER BY for a TLD filter, so
+    # the page can be read in index order and stop at LIMIT instead of sorting.
+    # PostgreSQL also carries the remaining listing columns for index-only scans.
+    op.create_index(
+        'idx_drop_listing',
+        'dropped_domains',
+        ['tld_id', 'drop_date', 'quality_score', 'domain'],
+        unique=False,
+        postgresql_include=['length', 'charset_type']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_drop_listing', table_name='dropped_domains')
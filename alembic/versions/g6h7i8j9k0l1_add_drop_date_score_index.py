@@ -0,0 +1,35 @@
+"""Add drop date / score index on dropped_domains
+
+Revision ID: g6h7i8j9k0l1
+Revises: f5g6h7i8j9k0
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g6h7i8j9k0l1'
+down_revision: Union[str, None] = 'f5g6h7i8j9k0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the /droptoday ORDER BY (score DESC, domain) within a single date,
+    # so an unfiltered page is an index range scan with no sort step. NULL is
+    # the lowest value on MySQL, so unscored domains land at the end of the
+    # descending score order, the same as the query's.
+    op.create_index(
+        'idx_drop_date_score',
+        'dropped_domains',
+        ['drop_date', sa.text('quality_score DESC'), 'domain'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_drop_date_score', table_name='dropped_domains')
@@ -0,0 +1,43 @@
+"""Add trigram index on dropped_domains.domain (PostgreSQL only)
+
+Revision ID: h7i8j9k0l1m2
+Revises: g6h7i8j9k0l1
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h7i8j9k0l1m2'
+down_revision: Union[str, None] = 'g6h7i8j9k0l1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Substring search (LIKE '%term%') can't use a btree index. On PostgreSQL a
+    # pg_trgm GIN index serves it directly; MySQL has no equivalent, so there
+    # the search stays a scan within the date/TLD the page already narrows to.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_drop_domain_trgm',
+        'dropped_domains',
+        ['domain'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'domain': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('idx_drop_domain_trgm', table_name='dropped_domains')
@@ -0,0 +1,29 @@
+"""Store TLD names lowercase
+
+Revision ID: i8j9k0l1m2n3
+Revises: h7i8j9k0l1m2
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i8j9k0l1m2n3'
+down_revision: Union[str, None] = 'h7i8j9k0l1m2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Listing filters resolve the requested TLD against these names with a
+    # plain lowercase comparison; the unique index on name already exists
+    op.execute('UPDATE tlds SET name = LOWER(name)')
+
+
+def downgrade() -> None:
+    # Original casing isn't recorded; lowercase names remain valid
+    pass
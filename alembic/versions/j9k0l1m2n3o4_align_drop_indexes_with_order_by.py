@@ -0,0 +1,72 @@
+"""Align dropped_domains listing indexes with the listing ORDER BYs
+
+Revision ID: j9k0l1m2n3o4
+Revises: i8j9k0l1m2n3
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j9k0l1m2n3o4'
+down_revision: Union[str, None] = 'i8j9k0l1m2n3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _analyze() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.execute('ANALYZE TABLE dropped_domains')
+    elif bind.dialect.name == 'postgresql':
+        op.execute('ANALYZE dropped_domains')
+
+
+def upgrade() -> None:
+    # Listings order by drop_date DESC, quality_score DESC, domain. An index
+    # can only replace the sort when its column directions match exactly
+    # (or are all reversed), so both listing indexes are rebuilt with the
+    # same directions. NULL sorts lowest on MySQL, so unscored domains
+    # stay last in the descending score order.
+    op.drop_index('idx_drop_listing', table_name='dropped_domains')
+    op.create_index(
+        'idx_drop_listing',
+        'dropped_domains',
+        ['tld_id', sa.text('drop_date DESC'), sa.text('quality_score DESC'), 'domain'],
+        unique=False,
+        postgresql_include=['length', 'charset_type']
+    )
+    
+    op.drop_index('idx_drop_date_score', table_name='dropped_domains')
+    op.create_index(
+        'idx_drop_date_score',
+        'dropped_domains',
+        [sa.text('drop_date DESC'), sa.text('quality_score DESC'), 'domain'],
+        unique=False,
+        postgresql_include=['tld_id', 'length', 'charset_type']
+    )
+    
+    _analyze()
+
+
+def downgrade() -> None:
+    op.drop_index('idx_drop_date_score', table_name='dropped_domains')
+    op.create_index(
+        'idx_drop_date_score',
+        'dropped_domains',
+        ['drop_date', sa.text('quality_score DESC'), 'domain'],
+        unique=False
+    )
+    
+    op.drop_index('idx_drop_listing', table_name='dropped_domains')
+    op.create_index(
+        'idx_drop_listing',
+        'dropped_domains',
+        ['tld_id', 'drop_date', 'quality_score', 'domain'],
+        unique=False,
+        postgresql_include=['length', 'charset_type']
+    )
@@ -0,0 +1,34 @@
+"""Add charset index on dropped_domains for charset-filtered listings
+
+Revision ID: k0l1m2n3o4p5
+Revises: j9k0l1m2n3o4
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k0l1m2n3o4p5'
+down_revision: Union[str, None] = 'j9k0l1m2n3o4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Watchlist matches filter on the stored charset_type and order by
+    # drop_date DESC, quality_score DESC; leading with charset_type lets one
+    # index range serve both the filter and the order
+    op.create_index(
+        'idx_drop_charset_date',
+        'dropped_domains',
+        ['charset_type', sa.text('drop_date DESC'), sa.text('quality_score DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_drop_charset_date', table_name='dropped_domains')
@@ -0,0 +1,68 @@
+"""Declare quality_score NULLS LAST in dropped_domains indexes on PostgreSQL
+
+Revision ID: l1m2n3o4p5q6
+Revises: k0l1m2n3o4p5
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l1m2n3o4p5q6'
+down_revision: Union[str, None] = 'k0l1m2n3o4p5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_indexes(score_key: str) -> None:
+    op.create_index(
+        'idx_drop_listing',
+        'dropped_domains',
+        ['tld_id', sa.text('drop_date DESC'), sa.text(score_key), 'domain'],
+        unique=False,
+        postgresql_include=['length', 'charset_type']
+    )
+    op.create_index(
+        'idx_drop_date_score',
+        'dropped_domains',
+        [sa.text('drop_date DESC'), sa.text(score_key), 'domain'],
+        unique=False,
+        postgresql_include=['tld_id', 'length', 'charset_type']
+    )
+    op.create_index(
+        'idx_drop_charset_date',
+        'dropped_domains',
+        ['charset_type', sa.text('drop_date DESC'), sa.text(score_key)],
+        unique=False
+    )
+
+
+def _drop_indexes() -> None:
+    op.drop_index('idx_drop_charset_date', table_name='dropped_domains')
+    op.drop_index('idx_drop_date_score', table_name='dropped_domains')
+    op.drop_index('idx_drop_listing', table_name='dropped_domains')
+
+
+def upgrade() -> None:
+    # PostgreSQL sorts NULL highest, so listings order by quality_score DESC
+    # NULLS LAST there to keep unscored domains last. A plain DESC key sorts
+    # them first and can't supply that order, so the keys are rebuilt to
+    # match. MySQL sorts NULL lowest and keeps its plain DESC indexes.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    _drop_indexes()
+    _create_indexes('quality_score DESC NULLS LAST')
+    op.execute('ANALYZE dropped_domains')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    _drop_indexes()
+    _create_indexes('quality_score DESC')
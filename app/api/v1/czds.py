@@ -169,6 +169,7 @@ async def download_zone(
         if auto_process and request.tld and path.exists():
             try:
                 from app.core.database import SessionLocal
+                from app.core.tld_cache import invalidate_active_tlds
                 from app.models.tld import Tld
                 from app.services.zone_parser import extract_slds_from_zone
                 from app.services.drop_detector import compute_dropped_slds, persist_drops
@@ -200,6 +201,7 @@ async def download_zone(
                         db.add(tld_obj)
                         db.commit()
                         db.refresh(tld_obj)
+                        invalidate_active_tlds()
                     
                     # Parse zone file
                     slds = extract_slds_from_zone(path, request.tld)
@@ -5,12 +5,14 @@ from datetime import date
 from typing import Optional, List
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import and_
 
 from app.core.database import get_db
+from app.core.drop_cache import get_latest_drop_date
+from app.core.drop_rows import query_drop_rows, to_drop_reads
+from app.core.tld_cache import drop_tld_filter
 from app.models.drop import DroppedDomain
-from app.models.tld import Tld
-from app.schemas.drop import DropRead, DropListResponse
+from app.schemas.drop import DropListResponse
 
 router = APIRouter()
 
@@ -33,11 +35,11 @@ def list_drops(
     If no date is provided, defaults to the latest available date in the database.
     """
     # Build query
-    query = db.query(DroppedDomain).join(Tld)
+    query = query_drop_rows(db)
     
     # Date filter: if not provided, use latest date
     if date_filter is None:
-        latest_date = db.query(func.max(DroppedDomain.drop_date)).scalar()
+        latest_date = get_latest_drop_date(db)
         if latest_date:
             date_filter = latest_date
         else:
@@ -48,15 +50,14 @@ def list_drops(
     
     # TLD filter
     if tld:
-        query = query.filter(Tld.name == tld.lower())
+        query = query.filter(drop_tld_filter(db, tld))
     
     # Search filter
     if search:
-        search_term = f"%{search.lower()}%"
+        # Domains are stored lowercase, so a plain LIKE matches without
+        # lower() on every row; % and _ in the input are matched literally
         query = query.filter(
-            or_(
-                DroppedDomain.domain.ilike(search_term)
-            )
+            DroppedDomain.domain.contains(search.lower(), autoescape=True)
         )
     
     # Length filters
@@ -76,18 +77,8 @@ def list_drops(
     offset = (page - 1) * page_size
     drops = query.order_by(DroppedDomain.domain).offset(offset).limit(page_size).all()
     
-    # Convert to schema (include TLD name)
-    results = [
-        DropRead(
-            id=drop.id,
-            domain=drop.domain,
-            tld=drop.tld.name,
-            drop_date=drop.drop_date,
-            length=drop.length,
-            charset_type=drop.charset_type
-        )
-        for drop in drops
-    ]
+    # Convert to schema (rows already carry the TLD name)
+    results = to_drop_reads(drops)
     
     return DropListResponse(
         total=total,
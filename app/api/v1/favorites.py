@@ -10,6 +10,7 @@ from sqlalchemy import and_
 from app.core.database import get_db
 from app.models.user import User, UserFavorite
 from app.models.drop import DroppedDomain
+from app.models.tld import Tld
 from app.services.subscription_service import SubscriptionService, get_subscription_service
 from app.web.auth_web import get_current_user_from_cookie
 from fastapi import Request
@@ -74,14 +75,16 @@ def create_favorite(
         raise HTTPException(status_code=404, detail="Domain not found")
     
     # Check if already favorited
-    existing = db.query(UserFavorite).filter(
-        and_(
-            UserFavorite.user_id == user.id,
-            UserFavorite.domain_id == favorite.domain_id
-        )
-    ).first()
-    
-    if existing:
+    already_favorited = db.query(
+        db.query(UserFavorite.id).filter(
+            and_(
+                UserFavorite.user_id == user.id,
+                UserFavorite.domain_id == favorite.domain_id
+            )
+        ).exists()
+    ).scalar()
+    
+    if already_favorited:
         raise HTTPException(status_code=400, detail="Domain already in favorites")
     
     # Create favorite
@@ -121,15 +124,23 @@ def list_favorites(
     
     favorites = query.order_by(UserFavorite.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
     
-    # Enrich with domain info
+    # Enrich with domain info: one IN query for the whole page, then dict lookups
+    domain_ids = {fav.domain_id for fav in favorites}
+    domains = {
+        row.id: row
+        for row in db.query(
+            DroppedDomain.id, DroppedDomain.domain, Tld.name.label("tld")
+        ).join(DroppedDomain.tld).filter(DroppedDomain.id.in_(domain_ids)).all()
+    } if domain_ids else {}
+    
     results = []
     for fav in favorites:
-        domain = db.query(DroppedDomain).filter(DroppedDomain.id == fav.domain_id).first()
+        domain = domains.get(fav.domain_id)
         results.append(FavoriteResponse(
             id=fav.id,
             domain_id=fav.domain_id,
             domain=domain.domain if domain else None,
-            tld=domain.tld.name if domain and domain.tld else None,
+            tld=domain.tld if domain else None,
             notes=fav.notes,
             created_at=fav.created_at.isoformat() if fav.created_at else ""
         ))
@@ -184,16 +195,17 @@ def check_favorite(
     if not user:
         raise HTTPException(status_code=401, detail="Authentication required")
     
-    favorite = db.query(UserFavorite).filter(
+    # Only the id is needed, which the (user_id, domain_id) index already holds
+    favorite_id = db.query(UserFavorite.id).filter(
         and_(
             UserFavorite.user_id == user.id,
             UserFavorite.domain_id == domain_id
         )
-    ).first()
+    ).scalar()
     
     return {
-        "is_favorite": favorite is not None,
-        "favorite_id": favorite.id if favorite else None
+        "is_favorite": favorite_id is not None,
+        "favorite_id": favorite_id
     }
 
 
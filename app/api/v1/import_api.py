@@ -13,9 +13,12 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 
 from app.core.database import get_db
 from app.core.config import get_settings
+from app.core.drop_cache import invalidate_drop_caches
+from app.core.tld_cache import invalidate_active_tlds
 from app.models.tld import Tld
 from app.models.drop import DroppedDomain
-from app.services.zone_parser import extract_slds_from_zone, extract_slds_from_zone_chunked, build_domain_name
+from app.services.zone_parser import extract_slds_from_zone, extract_slds_from_zone_chunked
+from app.services.drop_detector import bulk_insert_domains
 from app.services.import_logger import ImportLogger, logger
 from app.services.progress_tracker import ProgressTracker
 
@@ -115,6 +118,7 @@ async def import_all_zones(db: Session = Depends(get_db)) -> Dict:
                 db.add(tld_obj)
                 db.commit()
                 db.refresh(tld_obj)
+                invalidate_active_tlds()
             
             for zone_file in zone_files:
                 import_log = ImportLogger(tld_name, "import_all")
@@ -125,41 +129,15 @@ async def import_all_zones(db: Session = Depends(get_db)) -> Dict:
                     slds = extract_slds_from_zone(zone_file, tld_name)
                     import_log.start(len(slds))
                     
-                    imported = 0
-                    skipped = 0
-                    
-                    for sld in sorted(slds):
-                        domain = build_domain_name(sld, tld_name)
-                        
-                        exists = db.query(DroppedDomain).filter(
-                            DroppedDomain.domain == domain,
-                            DroppedDomain.drop_date == file_date
-                        ).first()
-                        
-                        if exists:
-                            skipped += 1
-                            continue
-                        
-                        dropped_domain = DroppedDomain(
-                            domain=domain,
-                            tld_id=tld_obj.id,
-                            drop_date=file_date,
-                            length=len(sld),
-                            label_count=1,
-                            charset_type=_determine_charset_type(sld)
-                        )
-                        
-                        try:
-                            db.add(dropped_domain)
-                            db.commit()
-                            imported += 1
-                        except IntegrityError:
-                            db.rollback()
-                            skipped += 1
+                    # slds is already a set, so batches carry no repeats;
+                    # stored domains are filtered with one query up front
+                    # instead of a SELECT and commit per domain
+                    imported, skipped = bulk_insert_domains(db, tld_obj, file_date, slds)
                     
                     tld_obj.last_import_date = file_date
                     tld_obj.last_drop_count = imported
                     db.commit()
+                    invalidate_drop_caches()
                     
                     import_log.set_stat("imported", imported)
                     import_log.set_stat("skipped", skipped)
@@ -272,6 +250,7 @@ async def import_single_zone(
             db.add(tld_obj)
             db.commit()
             db.refresh(tld_obj)
+            invalidate_active_tlds()
             import_log.log_info(f"Created new TLD record: {tld.lower()}")
         
         # Get existing domains first (for duplicate checking)
@@ -339,9 +318,11 @@ async def import_single_zone(
         
         import_log.log_info(f"Starting batch insert (batch_size={BATCH_SIZE}, throttle_every={THROTTLE_EVERY})")
         
+        # Domain suffix is the same for every SLD; build it once outside the loop
+        domain_suffix = "." + tld.lower()
         slds_list = list(slds)
         for i, sld in enumerate(slds_list):
-            domain = build_domain_name(sld, tld.lower())
+            domain = sld + domain_suffix
             
             if domain in existing_domains:
                 skipped += 1
@@ -393,6 +374,7 @@ async def import_single_zone(
         tld_obj.last_import_date = file_date
         tld_obj.last_drop_count = imported
         db.commit()
+        invalidate_drop_caches()
         
         # Log completion
         import_log.set_stat("imported", imported)
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.tld_cache import invalidate_active_tlds
 from app.models.tld import Tld
 from app.services.zone_parser import extract_slds_from_zone
 from app.services.drop_detector import (
@@ -101,6 +102,7 @@ async def detect_drops(
             db.add(tld_obj)
             db.commit()
             db.refresh(tld_obj)
+            invalidate_active_tlds()
         
         # Load SLD sets
         try:
@@ -206,6 +208,7 @@ async def process_downloaded_zone(
                         db.add(tld_obj)
                         db.commit()
                         db.refresh(tld_obj)
+                        invalidate_active_tlds()
                     
                     # Load previous day's SLDs
                     prev_set = extract_slds_from_zone(prev_zone_path, tld.lower())
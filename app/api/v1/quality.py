@@ -4,11 +4,12 @@ API endpoints for domain quality scoring.
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from app.core.database import get_db
+from app.core.drop_cache import get_latest_drop_date
+from app.core.tld_cache import drop_tld_filter
 from app.models.drop import DroppedDomain
-from app.models.tld import Tld
 from app.services.quality_scorer import (
     calculate_quality_score,
     get_quality_tier,
@@ -145,9 +146,10 @@ def get_top_quality_domains(
     Returns domains sorted by quality score (calculated on-the-fly).
     """
     from datetime import date as date_type
-    from sqlalchemy import func, desc
     
-    query = db.query(DroppedDomain).join(Tld)
+    query = db.query(DroppedDomain).join(DroppedDomain.tld).options(
+        contains_eager(DroppedDomain.tld)
+    )
     
     # Date filter
     if date:
@@ -158,13 +160,13 @@ def get_top_quality_domains(
             raise HTTPException(status_code=400, detail="Invalid date format")
     else:
         # Default to latest date
-        latest_date = db.query(func.max(DroppedDomain.drop_date)).scalar()
+        latest_date = get_latest_drop_date(db)
         if latest_date:
             query = query.filter(DroppedDomain.drop_date == latest_date)
     
     # TLD filter
     if tld:
-        query = query.filter(Tld.name == tld.lower())
+        query = query.filter(drop_tld_filter(db, tld))
     
     # Get domains and calculate scores
     domains = query.limit(500).all()  # Get more to filter by score
@@ -0,0 +1,85 @@
+"""
+Small in-process TTL cache for read-mostly data shared across requests.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache whose entries expire after a fixed number of seconds.
+    
+    Routes run on the threadpool, so lookups and stores are guarded by a lock.
+    A missing value is computed under a per-key lock rather than the shared
+    one: a slow query doesn't block readers of other keys, and concurrent
+    misses on the same key wait for the first caller's result instead of
+    each running the query.
+    """
+    
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry stays fresh after it is stored
+        """
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def _fresh_entry(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        Return the stored entry for key if it hasn't expired; caller holds _lock.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+        return None
+    
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it if missing or expired.
+        
+        Args:
+            key: Cache key
+            factory: Zero-argument callable producing the value
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        with self._lock:
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                return entry[1]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            # Another caller may have stored the value while this one waited
+            with self._lock:
+                entry = self._fresh_entry(key)
+                if entry is not None:
+                    return entry[1]
+            
+            value = factory()
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+    
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop one cached entry, if present.
+        
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """
+        Drop all cached entries.
+        """
+        with self._lock:
+            self._entries.clear()
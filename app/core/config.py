@@ -15,6 +15,12 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "mysql+pymysql://root:@localhost:3306/expireddomain"
     
+    # Connection pool (sync routes run on a 40-thread pool, so keep enough
+    # connections that concurrent requests don't queue on pool checkout)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 3600  # seconds; stays below MySQL's wait_timeout
+    
     # CZDS API (optional - can work with local files)
     CZDS_USERNAME: str | None = None
     CZDS_PASSWORD: str | None = None
@@ -2,6 +2,7 @@
 Database configuration and session management.
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -10,12 +11,27 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+# Rows per multi-row INSERT when SQLAlchemy batches an executemany
+# (insertmanyvalues); PyMySQL already folds plain executemany INSERTs into
+# multi-row statements on its own
+EXECUTEMANY_PAGE_SIZE = 10000
+
+# psycopg2 otherwise runs executemany UPDATE/DELETE one statement per row
+_driver_options = {}
+if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2":
+    _driver_options = {"executemany_mode": "values_plus_batch"}
+
 # Create engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    insertmanyvalues_page_size=EXECUTEMANY_PAGE_SIZE,
     future=True,
-    echo=False  # Set to True for SQL debugging
+    echo=False,  # Set to True for SQL debugging
+    **_driver_options
 )
 
 # Session factory
@@ -0,0 +1,95 @@
+"""
+Process-wide caches of drop aggregates shown on listing and status pages.
+"""
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.models.drop import DroppedDomain
+
+
+# A new drop date only appears when a daily import finishes
+LATEST_DROP_DATE_TTL_SECONDS = 60
+_latest_drop_date_cache = TTLCache(LATEST_DROP_DATE_TTL_SECONDS)
+
+# Per-day, per-TLD rollup of dropped_domains. It scans the whole table, so
+# only the debug page reads it; listing pages use the per-date counts below.
+DROP_COUNTS_TTL_SECONDS = 60
+_drop_counts_cache = TTLCache(DROP_COUNTS_TTL_SECONDS)
+
+# Drop counts for one date (optionally one TLD), each an indexed range count
+_day_counts_cache = TTLCache(DROP_COUNTS_TTL_SECONDS)
+
+
+def get_latest_drop_date(db: Session) -> Optional[date]:
+    """
+    Get the most recent drop_date in dropped_domains, cached for LATEST_DROP_DATE_TTL_SECONDS.
+    
+    Args:
+        db: Database session, only used when the cache needs refreshing
+        
+    Returns:
+        Latest drop date, or None if there are no drops
+    """
+    return _latest_drop_date_cache.get_or_set(
+        "latest", lambda: db.query(func.max(DroppedDomain.drop_date)).scalar()
+    )
+
+
+def get_drop_counts(db: Session) -> Dict[Tuple[int, date], int]:
+    """
+    Get drop counts keyed by (tld_id, drop_date), cached for DROP_COUNTS_TTL_SECONDS.
+    
+    Args:
+        db: Database session, only used when the cache needs refreshing
+        
+    Returns:
+        Dictionary mapping (tld_id, drop_date) to number of drops
+    """
+    return _drop_counts_cache.get_or_set("by_tld_date", lambda: {
+        (tld_id, drop_date): count
+        for tld_id, drop_date, count in db.query(
+            DroppedDomain.tld_id,
+            DroppedDomain.drop_date,
+            func.count(DroppedDomain.id)
+        ).group_by(DroppedDomain.tld_id, DroppedDomain.drop_date).all()
+    })
+
+
+def count_drops_on(db: Session, drop_date: date, tld_id: Optional[int] = None) -> int:
+    """
+    Number of drops on a given date, cached for DROP_COUNTS_TTL_SECONDS.
+    
+    Counted on the (drop_date) or (tld_id, drop_date) index prefix rather
+    than from the full rollup, so each refresh only touches that day's rows.
+    
+    Args:
+        db: Database session, only used when the cache needs refreshing
+        drop_date: Date to count
+        tld_id: Only count this TLD; all TLDs if None
+        
+    Returns:
+        Number of drops on that date
+    """
+    def count() -> int:
+        query = db.query(func.count(DroppedDomain.id)).filter(DroppedDomain.drop_date == drop_date)
+        if tld_id is not None:
+            query = query.filter(DroppedDomain.tld_id == tld_id)
+        return query.scalar()
+    
+    return _day_counts_cache.get_or_set((drop_date, tld_id), count)
+
+
+def invalidate_drop_caches() -> None:
+    """
+    Drop the cached latest date and counts so the next request reloads them.
+    
+    Called after drops are committed, so pages served by this process show
+    a finished import right away instead of after the TTL.
+    """
+    _latest_drop_date_cache.clear()
+    _drop_counts_cache.clear()
+    _day_counts_cache.clear()
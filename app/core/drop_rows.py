@@ -0,0 +1,90 @@
+"""
+Column-projected drop queries for list pages and endpoints.
+"""
+from typing import Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session
+
+from app.models.drop import DroppedDomain
+from app.models.tld import Tld
+from app.schemas.drop import DropRead
+
+
+# Exactly the columns DropRead needs; labels match its field names
+DROP_READ_COLUMNS = (
+    DroppedDomain.id,
+    DroppedDomain.domain,
+    Tld.name.label("tld"),
+    DroppedDomain.drop_date,
+    DroppedDomain.length,
+    DroppedDomain.charset_type,
+)
+
+
+def query_drop_rows(db: Session) -> Query:
+    """
+    ORM query over DROP_READ_COLUMNS, joined to the TLD name.
+    
+    Rows come back as plain tuples, skipping identity-map and attribute
+    instrumentation for objects that are only read once.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Query that further filters can be chained onto
+    """
+    return db.query(*DROP_READ_COLUMNS).select_from(DroppedDomain).join(DroppedDomain.tld)
+
+
+def select_drop_rows():
+    """
+    Core SELECT counterpart of query_drop_rows.
+    """
+    return select(*DROP_READ_COLUMNS).select_from(DroppedDomain).join(DroppedDomain.tld)
+
+
+def quality_score_desc(db: Session):
+    """
+    quality_score DESC with unscored drops last, matching the listing indexes.
+    
+    MySQL sorts NULL lowest, so plain DESC already puts them last and the
+    index still supplies the order; PostgreSQL sorts NULL highest and needs
+    NULLS LAST, which its index keys declare.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        ORDER BY clause for DroppedDomain.quality_score
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return DroppedDomain.quality_score.desc().nulls_last()
+    return DroppedDomain.quality_score.desc()
+
+
+def to_drop_reads(rows: Iterable) -> List[DropRead]:
+    """
+    Build DropRead objects from projected rows without re-validating them.
+    
+    The values come straight from typed columns, so model_construct is safe
+    and avoids running validation once per row.
+    
+    Args:
+        rows: Rows from query_drop_rows or select_drop_rows
+    
+    Returns:
+        List of DropRead
+    """
+    return [
+        DropRead.model_construct(
+            id=row.id,
+            domain=row.domain,
+            tld=row.tld,
+            drop_date=row.drop_date,
+            length=row.length,
+            charset_type=row.charset_type
+        )
+        for row in rows
+    ]
@@ -0,0 +1,88 @@
+"""
+Process-wide cache of the active TLD list used by page filters.
+"""
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.models.drop import DroppedDomain
+from app.models.tld import Tld
+
+
+# TLDs are only added or toggled by imports and admin actions, so a
+# minute of staleness in filter dropdowns is acceptable
+ACTIVE_TLDS_TTL_SECONDS = 60
+_active_tlds_cache = TTLCache(ACTIVE_TLDS_TTL_SECONDS)
+
+
+class TldRef(NamedTuple):
+    """Detached snapshot of a TLD row, safe to share across sessions."""
+    id: int
+    name: str
+    display_name: Optional[str]
+
+
+def get_active_tlds(db: Session) -> List[TldRef]:
+    """
+    Get active TLDs ordered by name, cached for ACTIVE_TLDS_TTL_SECONDS.
+    
+    Args:
+        db: Database session, only used when the cache needs refreshing
+        
+    Returns:
+        List of TldRef tuples
+    """
+    return _active_tlds_cache.get_or_set("active", lambda: [
+        TldRef(*row)
+        for row in db.query(Tld.id, Tld.name, Tld.display_name).filter(
+            Tld.is_active == True
+        ).order_by(Tld.name).all()
+    ])
+
+
+def find_active_tld(db: Session, tld_name: str) -> Optional[TldRef]:
+    """
+    Look up an active TLD by name in the cached list.
+    
+    Args:
+        db: Database session, only used when the cache needs refreshing
+        tld_name: TLD name as given by the user, any case
+        
+    Returns:
+        TldRef, or None if no active TLD has that name
+    """
+    tld_name = tld_name.lower()
+    for tld in get_active_tlds(db):
+        if tld.name == tld_name:
+            return tld
+    return None
+
+
+def drop_tld_filter(db: Session, tld_name: str):
+    """
+    Filter clause restricting dropped_domains to one TLD by name.
+    
+    Active TLDs resolve to their id through the cached list, so the clause
+    is on the indexed dropped_domains.tld_id rather than the joined name.
+    Unknown or inactive names fall back to comparing Tld.name, which needs
+    the query to join tlds.
+    
+    Args:
+        db: Database session, only used when the cache needs refreshing
+        tld_name: TLD name as given by the user, any case
+        
+    Returns:
+        SQLAlchemy filter clause
+    """
+    tld = find_active_tld(db, tld_name)
+    if tld is not None:
+        return DroppedDomain.tld_id == tld.id
+    return Tld.name == tld_name.lower()
+
+
+def invalidate_active_tlds() -> None:
+    """
+    Drop the cached TLD list so the next request reloads it.
+    """
+    _active_tlds_cache.clear()
@@ -29,6 +29,13 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting application...")
     
+    # Compile templates up front so first page views don't pay for it
+    try:
+        from app.web.templating import warm_templates
+        logger.info(f"Precompiled {warm_templates()} templates")
+    except Exception as e:
+        logger.warning(f"Could not precompile templates: {e}")
+    
     # Initialize and start the scheduler
     try:
         from app.services.scheduler_service import scheduler_service
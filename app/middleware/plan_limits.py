@@ -113,9 +113,9 @@ def check_plan_limit(limit_name: str):
             
             # Check limit
             service = get_subscription_service(db)
-            is_within_limit, current_usage, max_allowed = service.check_plan_limit(user, limit_name)
-            
-            if not is_within_limit:
+            if not service.is_within_plan_limit(user, limit_name):
+                # Only a rejection needs the exact usage for the message
+                _, current_usage, max_allowed = service.check_plan_limit(user, limit_name)
                 plan = service.get_user_plan(user)
                 raise HTTPException(
                     status_code=403,
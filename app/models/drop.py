@@ -2,12 +2,19 @@
 Dropped domain model.
 """
 from datetime import datetime
-from sqlalchemy import Column, BigInteger, String, Integer, SmallInteger, Date, DateTime, ForeignKey, Index
+from sqlalchemy import Column, BigInteger, String, Integer, SmallInteger, Date, DateTime, ForeignKey, Index, desc
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
 
+def _not_postgresql(ddl, target, bind, dialect=None, **kw) -> bool:
+    """
+    ddl_if callable for index variants MySQL and SQLite create.
+    """
+    return dialect.name != "postgresql"
+
+
 class DroppedDomain(Base):
     """Model representing a dropped domain."""
     
@@ -29,6 +36,33 @@ class DroppedDomain(Base):
     # Unique constraint: same domain cannot be dropped twice on the same date
     __table_args__ = (
         Index("idx_domain_drop_date", "domain", "drop_date", unique=True),
+        # Listing pages order by date (newest first), score (highest first),
+        # then name; column directions match so the index supplies that order.
+        # PostgreSQL sorts NULL highest, so its key is declared NULLS LAST to
+        # keep unscored domains last; MySQL sorts NULL lowest and can't
+        # declare it, so the plain DESC variant is created there
+        Index(
+            "idx_drop_listing", "tld_id", desc("drop_date"), desc("quality_score").nulls_last(), "domain",
+            postgresql_include=["length", "charset_type"]
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_drop_listing", "tld_id", desc("drop_date"), desc("quality_score"), "domain"
+        ).ddl_if(callable_=_not_postgresql),
+        # Same order without a TLD filter, for one date or across all dates
+        Index(
+            "idx_drop_date_score", desc("drop_date"), desc("quality_score").nulls_last(), "domain",
+            postgresql_include=["tld_id", "length", "charset_type"]
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_drop_date_score", desc("drop_date"), desc("quality_score"), "domain"
+        ).ddl_if(callable_=_not_postgresql),
+        # Charset-filtered watchlist matches, in listing date/score order
+        Index(
+            "idx_drop_charset_date", "charset_type", desc("drop_date"), desc("quality_score").nulls_last()
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_drop_charset_date", "charset_type", desc("drop_date"), desc("quality_score")
+        ).ddl_if(callable_=_not_postgresql),
     )
     
     def __repr__(self) -> str:
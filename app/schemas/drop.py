@@ -3,7 +3,7 @@ Pydantic schemas for dropped domains.
 """
 from datetime import date
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DropRead(BaseModel):
@@ -15,8 +15,7 @@ class DropRead(BaseModel):
     length: int
     charset_type: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DropListResponse(BaseModel):
@@ -1,13 +1,29 @@
 """
 Service layer for business logic.
+
+Re-exports are resolved on first access, so importing one service module
+(e.g. from the zone scripts) doesn't also load the CZDS client and its
+HTTP stack.
 """
-from app.services.czds_client import CZDSClient
-from app.services.zone_parser import extract_slds_from_zone, build_domain_name
-from app.services.drop_detector import (
-    load_sld_set_for_day,
-    compute_dropped_slds,
-    persist_drops
-)
+from importlib import import_module
+
+_EXPORTS = {
+    "CZDSClient": "app.services.czds_client",
+    "extract_slds_from_zone": "app.services.zone_parser",
+    "build_domain_name": "app.services.zone_parser",
+    "load_sld_set_for_day": "app.services.drop_detector",
+    "compute_dropped_slds": "app.services.drop_detector",
+    "persist_drops": "app.services.drop_detector",
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CZDSClient",
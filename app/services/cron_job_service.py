@@ -6,8 +6,8 @@ from datetime import datetime, date
 from typing import Optional, List, Tuple
 from pathlib import Path
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import func, case
 
 from app.models.cron_job import CronJob, CronJobLog, JobType, JobStatus, LogStatus
 from app.models.tld import Tld
@@ -17,6 +17,7 @@ from app.services.czds_client import CZDSClient
 from app.services.zone_parser import extract_slds_from_zone
 from app.services.drop_detector import load_sld_set_for_day, compute_dropped_slds, persist_drops
 from app.core.database import SessionLocal
+from app.core.tld_cache import invalidate_active_tlds
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -31,11 +32,23 @@ class CronJobService:
     
     # ============== CRUD Operations ==============
     
-    def get_all(self, skip: int = 0, limit: int = 100) -> Tuple[List[CronJob], int]:
-        """Get all cron jobs with pagination."""
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[List] = None
+    ) -> Tuple[List[CronJob], int]:
+        """
+        Get all cron jobs with pagination.
+        
+        If columns is given, only those CronJob attributes are loaded.
+        """
         total = self.db.query(func.count(CronJob.id)).scalar()
+        query = self.db.query(CronJob)
+        if columns:
+            query = query.options(load_only(*columns))
         jobs = (
-            self.db.query(CronJob)
+            query
             .order_by(CronJob.priority.asc(), CronJob.cron_hour.asc(), CronJob.cron_minute.asc())
             .offset(skip)
             .limit(limit)
@@ -72,6 +85,27 @@ class CronJobService:
             .scalar()
         )
     
+    def get_job_stats(self) -> dict:
+        """
+        Get aggregate statistics over all jobs in a single query.
+        
+        Returns:
+            Dict with total_runs, success_runs, enabled_count and running_count
+        """
+        total_runs, success_runs, enabled_count, running_count = self.db.query(
+            func.coalesce(func.sum(CronJob.total_runs), 0),
+            func.coalesce(func.sum(CronJob.success_count), 0),
+            func.coalesce(func.sum(case((CronJob.is_enabled == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((CronJob.last_status == JobStatus.RUNNING, 1), else_=0)), 0)
+        ).one()
+        
+        return {
+            "total_runs": int(total_runs),
+            "success_runs": int(success_runs),
+            "enabled_count": int(enabled_count),
+            "running_count": int(running_count)
+        }
+    
     def create(self, data: CronJobCreate) -> CronJob:
         """Create a new cron job."""
         # Check if job for this TLD already exists
@@ -314,6 +348,7 @@ class CronJobService:
                                 self.db.add(tld_record)
                                 self.db.commit()
                                 self.db.refresh(tld_record)
+                                invalidate_active_tlds()
                             
                             # Persist drops
                             drops_detected = persist_drops(self.db, tld_record, today, dropped_slds)
@@ -452,10 +487,17 @@ class CronJobService:
         
         logger.info(f"Initialized scheduler with {len(jobs)} jobs")
     
-    def get_scheduler_status(self) -> dict:
-        """Get current scheduler status."""
+    def get_scheduler_status(self, job_stats: Optional[dict] = None) -> dict:
+        """
+        Get current scheduler status.
+        
+        Args:
+            job_stats: Result of get_job_stats(), if the caller already has it
+        """
+        if job_stats is None:
+            job_stats = self.get_job_stats()
         status = scheduler_service.get_status()
-        status['enabled_count'] = self.get_enabled_count()
-        status['running_count'] = self.get_running_count()
+        status['enabled_count'] = job_stats['enabled_count']
+        status['running_count'] = job_stats['running_count']
         return status
 
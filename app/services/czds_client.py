@@ -5,11 +5,13 @@ Supports both API-based downloads and local file mode.
 """
 import gzip
 import json
+import threading
 import time
 from pathlib import Path
 from datetime import date, datetime, timedelta
 from typing import Optional, List, Dict
 import requests
+from requests.adapters import HTTPAdapter
 try:
     import jwt
 except ImportError:
@@ -58,6 +60,14 @@ class CZDSClient:
         # Token cache
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        # One client is shared by fetch_drops' worker threads; only one of
+        # them should hit the rate-limited auth endpoint when the token is stale
+        self._token_lock = threading.Lock()
+        
+        # One keep-alive session for all calls, so consecutive zone downloads
+        # reuse TLS connections; sized for several TLDs downloading at once
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
         
         # Ensure data directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -99,7 +109,7 @@ class CZDSClient:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.auth_url,
                 headers=headers,
                 json=payload,
@@ -153,17 +163,29 @@ class CZDSClient:
             Valid access token
         """
         # Check if token exists and is still valid (with 5 minute buffer)
+        if self._token_is_fresh():
+            return self._access_token
+        
+        with self._token_lock:
+            # Another thread may have refreshed it while this one waited
+            if self._token_is_fresh():
+                return self._access_token
+            
+            # Token expired or doesn't exist, authenticate
+            if not self.username or not self.password:
+                raise ValueError("CZDS credentials not configured. Please authenticate first.")
+            
+            self.authenticate()
+            return self._access_token
+    
+    def _token_is_fresh(self) -> bool:
+        """
+        Whether the cached token exists and is valid for at least 5 more minutes.
+        """
         if self._access_token and self._token_expires_at:
             buffer_time = datetime.now() + timedelta(minutes=5)
-            if self._token_expires_at > buffer_time:
-                return self._access_token
-        
-        # Token expired or doesn't exist, authenticate
-        if not self.username or not self.password:
-            raise ValueError("CZDS credentials not configured. Please authenticate first.")
-        
-        self.authenticate()
-        return self._access_token
+            return self._token_expires_at > buffer_time
+        return False
     
     def list_zones(self) -> List[str]:
         """
@@ -185,7 +207,7 @@ class CZDSClient:
         url = f"{self.base_url}/czds/downloads/links"
         
         try:
-            response = requests.get(url, headers=headers, timeout=60)
+            response = self.session.get(url, headers=headers, timeout=60)
             response.raise_for_status()
             
             zones = response.json()
@@ -215,7 +237,7 @@ class CZDSClient:
         }
         
         try:
-            response = requests.head(zone_url, headers=headers, timeout=60)
+            response = self.session.head(zone_url, headers=headers, timeout=60)
             response.raise_for_status()
             
             info = {
@@ -288,7 +310,7 @@ class CZDSClient:
         for attempt in range(max_retries):
             try:
                 # Use streaming for large files
-                response = requests.get(
+                response = self.session.get(
                     zone_url, 
                     headers=headers, 
                     stream=True, 
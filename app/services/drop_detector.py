@@ -1,16 +1,46 @@
 """
 Drop detection logic: compare zone files and persist dropped domains.
 """
-from datetime import date
+import hashlib
+import io
+import struct
+from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Set
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import func, insert, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from app.models.tld import Tld
 from app.models.drop import DroppedDomain
-from app.services.zone_parser import extract_slds_from_zone, build_domain_name
+from app.services.zone_parser import extract_slds_from_zone, iter_slds_from_zone
 from app.core.config import get_settings
+from app.core.drop_cache import invalidate_drop_caches
+
+# Rows per multi-row INSERT when persisting drops
+PERSIST_BATCH_SIZE = 1000
+# Rows per bulk insert when importing whole zone files
+IMPORT_BATCH_SIZE = 10_000
+# Previous-day SLDs looked up against the current zone per vectorized batch
+DIFF_BATCH_SIZE = 100_000
+# PostgreSQL binary COPY framing: signature, flags and header extension
+# length up front, a field count of -1 to end the data
+COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+COPY_BINARY_TRAILER = struct.pack(">h", -1)
+
+
+def _zone_path_for_day(tld: str, day: date) -> Path:
+    """
+    Path of the stored zone file for a TLD and day.
+    """
+    settings = get_settings()
+    date_str = day.strftime("%Y%m%d")
+    return Path(settings.DATA_DIR) / "zones" / tld.lower() / f"{date_str}.zone"
 
 
 def load_sld_set_for_day(tld: str, day: date) -> Set[str]:
@@ -27,11 +57,7 @@ def load_sld_set_for_day(tld: str, day: date) -> Set[str]:
     Raises:
         FileNotFoundError: If zone file doesn't exist
     """
-    settings = get_settings()
-    date_str = day.strftime("%Y%m%d")
-    zone_path = Path(settings.DATA_DIR) / "zones" / tld.lower() / f"{date_str}.zone"
-    
-    return extract_slds_from_zone(zone_path, tld)
+    return extract_slds_from_zone(_zone_path_for_day(tld, day), tld)
 
 
 def compute_dropped_slds(prev_set: Set[str], current_set: Set[str]) -> Set[str]:
@@ -48,6 +74,168 @@ def compute_dropped_slds(prev_set: Set[str], current_set: Set[str]) -> Set[str]:
     return prev_set - current_set
 
 
+def _sld_hash(sld: str) -> int:
+    """
+    64-bit hash of an SLD, used as its compact key in zone diffs.
+    """
+    return int.from_bytes(hashlib.blake2b(sld.encode(), digest_size=8).digest(), "little")
+
+
+def _load_sld_hashes(zone_path: Path, tld: str) -> np.ndarray:
+    """
+    Sorted, unique uint64 hashes of the SLDs in a zone file.
+    
+    8 bytes per SLD in one contiguous array, instead of a Python str object
+    and set slot per SLD.
+    """
+    return np.unique(np.fromiter(
+        (_sld_hash(sld) for sld in iter_slds_from_zone(zone_path, tld)),
+        dtype=np.uint64
+    ))
+
+
+def _stream_missing_slds(
+    zone_path: Path,
+    tld: str,
+    current_hashes: np.ndarray,
+    keep_hashes: bool = False
+) -> Tuple[Set[str], Optional[np.ndarray]]:
+    """
+    Stream a zone file and collect its SLDs whose hash isn't in current_hashes.
+    
+    SLDs are read in batches of DIFF_BATCH_SIZE whose hashes are looked up
+    in the sorted array with a vectorized binary search.
+    
+    Args:
+        zone_path: Zone file to stream
+        tld: Top-level domain of the file
+        current_hashes: Sorted, unique SLD hashes to compare against
+        keep_hashes: Also return the streamed file's own sorted, unique hashes
+        
+    Returns:
+        Tuple of (set of missing SLDs, the file's hashes or None)
+    """
+    missing: Set[str] = set()
+    hash_batches: List[np.ndarray] = []
+    
+    def diff_batch(batch: List[str]) -> None:
+        hashes = np.fromiter((_sld_hash(sld) for sld in batch), dtype=np.uint64, count=len(batch))
+        if keep_hashes:
+            hash_batches.append(np.unique(hashes))
+        if not len(current_hashes):
+            missing.update(batch)
+            return
+        positions = np.searchsorted(current_hashes, hashes)
+        # Hashes past the end of the array can't be present; clip so the
+        # comparison below is still a valid index
+        found = current_hashes[np.minimum(positions, len(current_hashes) - 1)] == hashes
+        missing.update(batch[i] for i in np.flatnonzero(~found))
+    
+    batch: List[str] = []
+    for sld in iter_slds_from_zone(zone_path, tld):
+        batch.append(sld)
+        if len(batch) >= DIFF_BATCH_SIZE:
+            diff_batch(batch)
+            batch = []
+    if batch:
+        diff_batch(batch)
+    
+    if not keep_hashes:
+        return missing, None
+    own_hashes = np.unique(np.concatenate(hash_batches)) if hash_batches else np.empty(0, dtype=np.uint64)
+    return missing, own_hashes
+
+
+def diff_zone_files(prev_path: Path, current_path: Path, tld: str) -> Tuple[Set[str], int]:
+    """
+    Compute SLDs in one zone file that are missing from another, streaming the first.
+    
+    The current zone is held only as a sorted array of 64-bit SLD hashes,
+    and the previous zone file is streamed against it (see
+    _stream_missing_slds); SLDs whose hash is missing are the drops, kept as
+    strings. With 64-bit keys, the chance of a collision hiding a drop is
+    negligible.
+    
+    Args:
+        prev_path: Zone file the domains were last seen in
+        current_path: Zone file to compare against
+        tld: Top-level domain of both files
+        
+    Returns:
+        Tuple of (set of dropped SLDs, number of SLDs in the current zone)
+        
+    Raises:
+        FileNotFoundError: If either zone file doesn't exist
+    """
+    if not prev_path.exists():
+        raise FileNotFoundError(f"Zone file not found: {prev_path}")
+    if not current_path.exists():
+        raise FileNotFoundError(f"Zone file not found: {current_path}")
+    
+    current_hashes = _load_sld_hashes(current_path, tld)
+    dropped, _ = _stream_missing_slds(prev_path, tld, current_hashes)
+    return dropped, len(current_hashes)
+
+
+def diff_zone_sequence(zone_paths: List[Path], tld: str) -> List[Tuple[Set[str], int]]:
+    """
+    Compute dropped SLDs for each consecutive pair in a run of zone files.
+    
+    Diffing pairs one at a time parses every inner file twice, once as the
+    current zone and once as the previous one. Walking the run newest first
+    instead, each file is streamed once: its SLDs are diffed against the
+    newer file's hashes while its own hashes are collected for the next,
+    older pair. Only two hash arrays are held at a time.
+    
+    Args:
+        zone_paths: Zone files of one TLD, oldest first
+        tld: Top-level domain of the files
+        
+    Returns:
+        One (set of dropped SLDs, number of SLDs in the newer zone) tuple per
+        pair, in the order of zone_paths: entry i compares zone_paths[i]
+        against zone_paths[i + 1]
+        
+    Raises:
+        FileNotFoundError: If any zone file doesn't exist
+    """
+    for zone_path in zone_paths:
+        if not zone_path.exists():
+            raise FileNotFoundError(f"Zone file not found: {zone_path}")
+    
+    results: List[Tuple[Set[str], int]] = [None] * (len(zone_paths) - 1)
+    current_hashes = _load_sld_hashes(zone_paths[-1], tld)
+    for i in range(len(zone_paths) - 2, -1, -1):
+        dropped, prev_hashes = _stream_missing_slds(zone_paths[i], tld, current_hashes, keep_hashes=True)
+        results[i] = (dropped, len(current_hashes))
+        current_hashes = prev_hashes
+    return results
+
+
+def stream_dropped_slds(tld: str, prev_day: date, current_day: date) -> Tuple[Set[str], int]:
+    """
+    Compute dropped SLDs between the stored zone files of two days.
+    
+    See diff_zone_files for how the zones are compared.
+    
+    Args:
+        tld: Top-level domain
+        prev_day: Day the domains were last seen
+        current_day: Day to compare against
+        
+    Returns:
+        Tuple of (set of dropped SLDs, number of SLDs in the current zone)
+        
+    Raises:
+        FileNotFoundError: If either zone file doesn't exist
+    """
+    return diff_zone_files(
+        _zone_path_for_day(tld, prev_day),
+        _zone_path_for_day(tld, current_day),
+        tld
+    )
+
+
 def _determine_charset_type(sld: str) -> str:
     """
     Determine charset type of an SLD.
@@ -66,10 +254,223 @@ def _determine_charset_type(sld: str) -> str:
         return "mixed"
 
 
+def _drop_row(domain: str, sld: str, tld_id: int, drop_date: date) -> dict:
+    """
+    Column values of a dropped_domains row for an SLD.
+    
+    Takes the already-built domain name, which callers need anyway for
+    their duplicate checks, so it isn't formatted twice per row.
+    """
+    return {
+        "domain": domain,
+        "tld_id": tld_id,
+        "drop_date": drop_date,
+        "length": len(sld),
+        "label_count": 1,  # Reserved for future use
+        "charset_type": _determine_charset_type(sld)
+    }
+
+
+def _existing_domains(db: Session, tld: Tld, drop_date: date) -> Set[str]:
+    """
+    Domains already stored for a TLD and date, read with one query.
+    """
+    return {
+        domain for (domain,) in db.query(DroppedDomain.domain).filter(
+            DroppedDomain.tld_id == tld.id,
+            DroppedDomain.drop_date == drop_date
+        ).all()
+    }
+
+
+def _insert_skipping_duplicates(db: Session):
+    """
+    INSERT into dropped_domains that skips rows already stored for the date.
+    
+    Conflicts on the (domain, drop_date) unique index are resolved by the
+    database in the same statement, instead of failing the batch and
+    rolling it back: ON CONFLICT DO NOTHING on PostgreSQL and SQLite, and a
+    no-op ON DUPLICATE KEY UPDATE on MySQL (unlike INSERT IGNORE, that
+    doesn't also hide truncation and other data errors).
+    
+    Args:
+        db: Database session, used to pick the dialect
+        
+    Returns:
+        Insert statement to execute with a list of row mappings
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return pg_insert(DroppedDomain).on_conflict_do_nothing(index_elements=["domain", "drop_date"])
+    if dialect == "sqlite":
+        return sqlite_insert(DroppedDomain).on_conflict_do_nothing(index_elements=["domain", "drop_date"])
+    if dialect == "mysql":
+        stmt = mysql_insert(DroppedDomain)
+        return stmt.on_duplicate_key_update(domain=stmt.inserted.domain)
+    return insert(DroppedDomain)
+
+
+class _ChunkStream(io.RawIOBase):
+    """
+    Read-only byte stream over an iterator of chunks, for COPY FROM STDIN.
+    """
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = bytearray()
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+def _copy_domains(db: Session, tld: Tld, drop_date: date, slds: Iterable[str]) -> None:
+    """
+    Load domains for a TLD and date with PostgreSQL COPY (psycopg2 only).
+    
+    The SLD stream is written in COPY's binary format straight into
+    COPY FROM STDIN on a constraint-free temp table, skipping per-row
+    statement parsing and protocol round trips; the server reads the
+    integer and text fields as-is instead of parsing CSV. One INSERT ...
+    SELECT DISTINCT then moves the rows over, so repeated SLDs in the zone
+    file can't fail the load.
+    
+    Args:
+        db: Database session on a psycopg2 connection
+        tld: TLD model instance
+        drop_date: Date to store the domains under
+        slds: SLDs to load, any order, repeats allowed
+    """
+    suffix = "." + tld.name.lower()
+    # Each row is 3 fields, each a 4-byte length then the value; the
+    # charset field only takes three values, so it's encoded up front
+    row_head = struct.Struct(">hi")
+    int4_field = struct.Struct(">ii")
+    charset_fields = {
+        charset: struct.pack(">i", len(charset)) + charset.encode()
+        for charset in ("letters", "numbers", "mixed")
+    }
+    
+    def binary_rows() -> Iterator[bytes]:
+        yield COPY_BINARY_HEADER
+        for sld in slds:
+            domain = (sld + suffix).encode()
+            yield b"".join((
+                row_head.pack(3, len(domain)),
+                domain,
+                int4_field.pack(4, len(sld)),
+                charset_fields[_determine_charset_type(sld)]
+            ))
+        yield COPY_BINARY_TRAILER
+    
+    db.execute(text(
+        "CREATE TEMP TABLE drop_import "
+        "(domain varchar(191), length integer, charset_type varchar(20)) ON COMMIT DROP"
+    ))
+    
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            "COPY drop_import (domain, length, charset_type) FROM STDIN WITH (FORMAT binary)",
+            _ChunkStream(binary_rows())
+        )
+    finally:
+        cursor.close()
+    
+    db.execute(text(
+        "INSERT INTO dropped_domains "
+        "(domain, tld_id, drop_date, length, label_count, charset_type, created_at) "
+        "SELECT DISTINCT domain, :tld_id, :drop_date, length, 1, charset_type, :created_at "
+        "FROM drop_import "
+        "ON CONFLICT (domain, drop_date) DO NOTHING"
+    ), {"tld_id": tld.id, "drop_date": drop_date, "created_at": datetime.utcnow()})
+    db.execute(text("DROP TABLE drop_import"))
+
+
+def bulk_insert_domains(db: Session, tld: Tld, drop_date: date, slds: Iterable[str]) -> Tuple[int, int]:
+    """
+    Insert domains for a TLD and date in batches of IMPORT_BATCH_SIZE rows.
+    
+    SLDs are consumed as a stream, so a zone file can be fed straight from
+    iter_slds_from_zone without building its full set; memory is bounded by
+    the batch size plus the domains already stored for the date. Those are
+    read with one query and left out in memory, and repeats within a batch
+    are dropped. Each batch is one executemany INSERT, which the driver sends
+    as multi-row VALUES statements instead of a round trip per row; repeats
+    across batches, and rows a concurrent import stored in the meantime, are
+    skipped by the database (see _insert_skipping_duplicates). Nothing is
+    committed; the caller commits once per zone file.
+    
+    On psycopg2, a first load for the date (nothing stored yet) goes through
+    COPY instead; see _copy_domains. On PostgreSQL the transaction also
+    commits without waiting for the WAL flush.
+    
+    Args:
+        db: Database session
+        tld: TLD model instance
+        drop_date: Date to store the domains under
+        slds: SLDs to insert, any order, repeats allowed
+        
+    Returns:
+        Tuple of (inserted count, count of domains that were already stored)
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # Imports are re-runnable, so the final commit needn't wait for the
+        # WAL flush; SET LOCAL ends with the caller's transaction
+        db.execute(text("SET LOCAL synchronous_commit = OFF"))
+    
+    existing = _existing_domains(db, tld, drop_date)
+    already_stored = set()
+    
+    if not existing and db.get_bind().dialect.driver == "psycopg2":
+        # Cold load: nothing to filter against, so COPY the whole stream
+        _copy_domains(db, tld, drop_date, slds)
+    else:
+        insert_stmt = _insert_skipping_duplicates(db)
+        # Loop invariants of build_domain_name and the row, resolved once
+        # rather than per SLD
+        suffix = "." + tld.name.lower()
+        tld_id = tld.id
+        sld_iter = iter(slds)
+        for chunk in iter(lambda: list(islice(sld_iter, IMPORT_BATCH_SIZE)), []):
+            batch = {}
+            for sld in chunk:
+                domain = sld + suffix
+                if domain in existing:
+                    already_stored.add(domain)
+                elif domain not in batch:
+                    batch[domain] = _drop_row(domain, sld, tld_id, drop_date)
+            if batch:
+                db.execute(insert_stmt, list(batch.values()))
+    
+    # Repeats across batches are only resolved by the database, so the
+    # inserted count comes from the stored total
+    stored = db.query(func.count(DroppedDomain.id)).filter(
+        DroppedDomain.tld_id == tld.id,
+        DroppedDomain.drop_date == drop_date
+    ).scalar()
+    return stored - len(existing), len(already_stored)
+
+
 def persist_drops(db: Session, tld: Tld, drop_date: date, slds: Set[str]) -> int:
     """
     Persist dropped domains to database and trigger watchlist matching.
     
+    Domains already stored for this date are skipped up front, and the rest
+    are written with multi-row INSERTs of PERSIST_BATCH_SIZE rows in a single
+    transaction, instead of one ORM add/commit round trip per domain.
+    
     Args:
         db: Database session
         tld: TLD model instance
@@ -79,42 +480,40 @@ def persist_drops(db: Session, tld: Tld, drop_date: date, slds: Set[str]) -> int
     Returns:
         Number of domains successfully persisted
     """
-    persisted_count = 0
-    persisted_domains = []  # Collect persisted domains for watchlist matching
+    # Re-runs for the same day are the only source of duplicates
+    existing = _existing_domains(db, tld, drop_date)
     
-    for sld in sorted(slds):
-        domain = build_domain_name(sld, tld.name)
-        
-        # Compute metadata
-        length = len(sld)
-        label_count = 1  # Reserved for future use
-        charset_type = _determine_charset_type(sld)
-        
-        # Create dropped domain record
-        dropped_domain = DroppedDomain(
-            domain=domain,
-            tld_id=tld.id,
-            drop_date=drop_date,
-            length=length,
-            label_count=label_count,
-            charset_type=charset_type
-        )
-        
-        try:
-            db.add(dropped_domain)
-            db.commit()
-            db.refresh(dropped_domain)  # Refresh to get ID
-            persisted_count += 1
-            persisted_domains.append(dropped_domain)
-        except IntegrityError:
-            # Domain already exists for this date, skip
-            db.rollback()
+    suffix = "." + tld.name.lower()
+    tld_id = tld.id
+    rows = []
+    for sld in slds:
+        domain = sld + suffix
+        if domain in existing:
             continue
+        
+        rows.append(_drop_row(domain, sld, tld_id, drop_date))
+    
+    insert_stmt = _insert_skipping_duplicates(db)
+    for start in range(0, len(rows), PERSIST_BATCH_SIZE):
+        db.execute(insert_stmt, rows[start:start + PERSIST_BATCH_SIZE])
+    persisted_count = len(rows)
     
     # Update TLD metadata
     tld.last_import_date = drop_date
     tld.last_drop_count = persisted_count
     db.commit()
+    invalidate_drop_caches()
+    
+    # Core inserts don't return objects; load the new rows for watchlist matching
+    persisted_domains = []
+    if persisted_count:
+        persisted_domains = [
+            dropped_domain for dropped_domain in db.query(DroppedDomain).filter(
+                DroppedDomain.tld_id == tld.id,
+                DroppedDomain.drop_date == drop_date
+            ).all()
+            if dropped_domain.domain not in existing
+        ]
     
     # Trigger watchlist matching for persisted domains
     if persisted_domains:
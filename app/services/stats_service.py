@@ -5,7 +5,7 @@ Provides aggregated stats for dashboard charts.
 from datetime import date, timedelta
 from typing import Dict, Any, List, Optional
 from sqlalchemy import func, and_, case
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from app.models.drop import DroppedDomain
 from app.models.tld import Tld
@@ -289,7 +289,9 @@ class StatsService:
         Returns:
             List of domain dicts
         """
-        query = self.db.query(DroppedDomain).join(Tld).filter(
+        query = self.db.query(DroppedDomain).join(DroppedDomain.tld).options(
+            contains_eager(DroppedDomain.tld)
+        ).filter(
             DroppedDomain.length <= max_length
         )
         
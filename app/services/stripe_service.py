@@ -16,6 +16,7 @@ except ImportError:
 from app.core.config import get_settings
 from app.models.user import User
 from app.models.subscription import SubscriptionPlan, UserSubscription, Payment, SubscriptionStatus, PaymentStatus
+from app.services.subscription_service import invalidate_plan_limits
 
 
 class StripeService:
@@ -248,6 +249,7 @@ class StripeService:
             db_subscription.canceled_at = datetime.utcnow()
         
         self.db.commit()
+        invalidate_plan_limits(db_subscription.user_id)
     
     def _handle_subscription_deleted(self, subscription: Dict[str, Any]):
         """Handle customer.subscription.deleted event."""
@@ -261,6 +263,7 @@ class StripeService:
             db_subscription.canceled_at = datetime.utcnow()
             db_subscription.user.is_premium = False
             self.db.commit()
+            invalidate_plan_limits(db_subscription.user_id)
     
     def _handle_payment_succeeded(self, invoice: Dict[str, Any]):
         """Handle invoice.payment_succeeded event."""
@@ -304,6 +307,7 @@ class StripeService:
         if db_subscription:
             db_subscription.status = SubscriptionStatus.PAST_DUE.value
             self.db.commit()
+            invalidate_plan_limits(db_subscription.user_id)
     
     def cancel_subscription(self, subscription: UserSubscription) -> bool:
         """
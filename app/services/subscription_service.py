@@ -6,12 +6,51 @@ from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 
+from app.core.cache import TTLCache
 from app.models.user import User
 from app.models.subscription import (
     SubscriptionPlan, UserSubscription, Payment, PlanType, SubscriptionStatus
 )
 
 
+# Plan limits per user, shared across requests. Limit checks run on every
+# watchlist/favorites page view, while a user's plan only changes through
+# subscription events, which invalidate the entry in this process; other
+# workers pick the change up within the TTL.
+PLAN_LIMITS_TTL_SECONDS = 60
+_plan_limits_cache = TTLCache(PLAN_LIMITS_TTL_SECONDS)
+
+
+def _parse_plan_limits(plan: SubscriptionPlan) -> Dict[str, Any]:
+    """
+    Get a plan's limits as a dictionary.
+    
+    Args:
+        plan: SubscriptionPlan object
+        
+    Returns:
+        Limits dictionary (empty if the plan has none)
+    """
+    # Handle JSON field - it might be None or already a dict
+    if plan.limits is None:
+        return {}
+    if isinstance(plan.limits, dict):
+        return plan.limits
+    # If it's a string, try to parse it (shouldn't happen with JSON field)
+    import json
+    return json.loads(plan.limits) if isinstance(plan.limits, str) else {}
+
+
+def invalidate_plan_limits(user_id: int) -> None:
+    """
+    Drop a user's cached plan limits after their subscription changes.
+    
+    Args:
+        user_id: User ID
+    """
+    _plan_limits_cache.invalidate(user_id)
+
+
 class SubscriptionService:
     """Service for managing subscriptions and plan limits."""
     
@@ -23,11 +62,30 @@ class SubscriptionService:
             db: Database session
         """
         self.db = db
+        # Plans resolved during this service's lifetime (one request), by user id.
+        # Limit and feature checks all start from the plan, so a page checking
+        # several of them would otherwise repeat the same two queries each time.
+        self._plans: Dict[int, SubscriptionPlan] = {}
     
     def get_user_plan(self, user: User) -> SubscriptionPlan:
         """
         Get user's current subscription plan.
         
+        Args:
+            user: User object
+            
+        Returns:
+            SubscriptionPlan object (defaults to FREE plan)
+        """
+        plan = self._plans.get(user.id)
+        if plan is None:
+            plan = self._plans[user.id] = self._load_user_plan(user)
+        return plan
+    
+    def _load_user_plan(self, user: User) -> SubscriptionPlan:
+        """
+        Query user's current subscription plan.
+        
         Args:
             user: User object
             
@@ -82,6 +140,20 @@ class SubscriptionService:
         
         return free_plan
     
+    def get_user_plan_limits(self, user: User) -> Dict[str, Any]:
+        """
+        Get the limits of user's current plan, cached for PLAN_LIMITS_TTL_SECONDS.
+        
+        Args:
+            user: User object
+            
+        Returns:
+            Limits dictionary
+        """
+        return _plan_limits_cache.get_or_set(
+            user.id, lambda: _parse_plan_limits(self.get_user_plan(user))
+        )
+    
     def get_user_subscription(self, user: User) -> Optional[UserSubscription]:
         """
         Get user's active subscription.
@@ -100,9 +172,90 @@ class SubscriptionService:
             )
         ).first()
     
+    def _usage_query(self, user: User, limit_name: str):
+        """
+        Query selecting one column of the rows that count toward a plan limit.
+        
+        Args:
+            user: User object
+            limit_name: Name of the limit
+            
+        Returns:
+            Query, or None for limits with no tracked usage
+        """
+        if limit_name == "watchlist_max":
+            from app.models.user import UserWatchlist
+            return self.db.query(UserWatchlist.id).filter(
+                UserWatchlist.user_id == user.id,
+                UserWatchlist.is_active == True
+            )
+        if limit_name == "favorites_max":
+            from app.models.user import UserFavorite
+            return self.db.query(UserFavorite.id).filter(
+                UserFavorite.user_id == user.id
+            )
+        if limit_name == "api_daily_limit":
+            from app.models.subscription import ApiKey
+            # Get API requests for today
+            today = datetime.utcnow().date()
+            return self.db.query(ApiKey.id).filter(
+                and_(
+                    ApiKey.user_id == user.id,
+                    ApiKey.is_active == True,
+                    func.date(ApiKey.last_used_at) == today
+                )
+            )  # This is simplified - should track actual API requests
+        return None
+    
+    def _count_usage(self, query, cap: Optional[int] = None) -> int:
+        """
+        Count the rows of a usage query, optionally reading at most cap rows.
+        
+        Args:
+            query: Query from _usage_query
+            cap: Stop counting after this many rows; exact count if None
+            
+        Returns:
+            Usage count, at most cap when one is given
+        """
+        if cap is None:
+            return query.with_entities(func.count()).scalar()
+        # LIMIT applies to the counted rows only inside a subquery
+        return self.db.query(func.count()).select_from(query.limit(cap).subquery()).scalar()
+    
+    def is_within_plan_limit(self, user: User, limit_name: str) -> bool:
+        """
+        Check whether a user can add another row under a plan limit.
+        
+        Only whether usage reaches the limit matters here, so the count runs
+        over a LIMIT max_allowed subquery and the database stops scanning
+        there. Use check_plan_limit when the usage is shown to the user.
+        
+        Args:
+            user: User object
+            limit_name: Name of the limit to check (e.g., "watchlist_max", "favorites_max")
+            
+        Returns:
+            True if usage is below the limit (or the plan is unlimited)
+        """
+        try:
+            max_allowed = self.get_user_plan_limits(user).get(limit_name, 0)
+            if max_allowed <= 0:
+                return True
+            
+            query = self._usage_query(user, limit_name)
+            if query is None:
+                return True
+            return self._count_usage(query, cap=max_allowed) < max_allowed
+        except Exception as e:
+            # Fallback to safe defaults
+            import logging
+            logging.getLogger(__name__).error(f"Error in is_within_plan_limit: {e}")
+            return True
+    
     def check_plan_limit(self, user: User, limit_name: str) -> tuple[bool, int, int | None]:
         """
-        Check if user has reached a plan limit.
+        Check if user has reached a plan limit, with the exact current usage.
         
         Args:
             user: User object
@@ -112,16 +265,7 @@ class SubscriptionService:
             Tuple of (is_within_limit, current_usage, max_allowed)
         """
         try:
-            plan = self.get_user_plan(user)
-            # Handle JSON field - it might be None or already a dict
-            if plan.limits is None:
-                limits = {}
-            elif isinstance(plan.limits, dict):
-                limits = plan.limits
-            else:
-                # If it's a string, try to parse it (shouldn't happen with JSON field)
-                import json
-                limits = json.loads(plan.limits) if isinstance(plan.limits, str) else {}
+            limits = self.get_user_plan_limits(user)
             
             max_allowed = limits.get(limit_name, 0)
         except Exception as e:
@@ -132,30 +276,8 @@ class SubscriptionService:
         
         # Get current usage based on limit type
         try:
-            if limit_name == "watchlist_max":
-                from app.models.user import UserWatchlist
-                current_usage = self.db.query(UserWatchlist).filter(
-                    UserWatchlist.user_id == user.id,
-                    UserWatchlist.is_active == True
-                ).count()
-            elif limit_name == "favorites_max":
-                from app.models.user import UserFavorite
-                current_usage = self.db.query(UserFavorite).filter(
-                    UserFavorite.user_id == user.id
-                ).count()
-            elif limit_name == "api_daily_limit":
-                from app.models.subscription import ApiKey
-                # Get API requests for today
-                today = datetime.utcnow().date()
-                current_usage = self.db.query(ApiKey).filter(
-                    and_(
-                        ApiKey.user_id == user.id,
-                        ApiKey.is_active == True,
-                        func.date(ApiKey.last_used_at) == today
-                    )
-                ).count()  # This is simplified - should track actual API requests
-            else:
-                current_usage = 0
+            query = self._usage_query(user, limit_name)
+            current_usage = self._count_usage(query) if query is not None else 0
             
             is_within_limit = current_usage < max_allowed if max_allowed > 0 else True
             
@@ -178,16 +300,7 @@ class SubscriptionService:
             True if user can access the feature
         """
         try:
-            plan = self.get_user_plan(user)
-            # Handle JSON field - it might be None or already a dict
-            if plan.limits is None:
-                limits = {}
-            elif isinstance(plan.limits, dict):
-                limits = plan.limits
-            else:
-                # If it's a string, try to parse it (shouldn't happen with JSON field)
-                import json
-                limits = json.loads(plan.limits) if isinstance(plan.limits, str) else {}
+            limits = self.get_user_plan_limits(user)
             
             # Admin users have access to all features
             if user.is_admin:
@@ -247,6 +360,7 @@ class SubscriptionService:
         )
         
         self.db.add(subscription)
+        self._plans.pop(user.id, None)
         
         # Update user premium status
         if plan.name != PlanType.FREE.value:
@@ -254,6 +368,7 @@ class SubscriptionService:
         
         self.db.commit()
         self.db.refresh(subscription)
+        invalidate_plan_limits(user.id)
         
         return subscription
     
@@ -281,8 +396,10 @@ class SubscriptionService:
             
             # Downgrade to free plan
             user.is_premium = False
+            self._plans.pop(user.id, None)
         
         self.db.commit()
+        invalidate_plan_limits(user.id)
         return True
     
     def get_plan_features(self, plan: SubscriptionPlan) -> Dict[str, Any]:
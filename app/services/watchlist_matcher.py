@@ -2,10 +2,19 @@
 Watchlist matching service for dropped domains.
 """
 import re
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, FrozenSet, Optional, Pattern
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
+try:
+    # Linear-time matching for user-supplied patterns; stdlib re backtracks
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
 from app.models.user import UserWatchlist, User
 from app.models.drop import DroppedDomain
 from app.models.notification import Notification, NotificationChannel, NotificationStatus
@@ -16,6 +25,133 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def compile_domain_pattern(domain_pattern: str) -> Optional[Pattern]:
+    """
+    Compile a watchlist domain pattern once, with * as a wildcard.
+    
+    Uses RE2 when installed, so a pathological pattern can't hang the
+    matcher with catastrophic backtracking. Patterns RE2 rejects (such as
+    lookarounds or backreferences) fall back to stdlib re.
+    
+    Args:
+        domain_pattern: Pattern from the watchlist
+        
+    Returns:
+        Compiled case-insensitive regex, or None if neither engine accepts it
+    """
+    pattern = domain_pattern.replace('*', '.*')  # Simple wildcard support
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile('(?i)' + pattern)
+        except re2.error:
+            pass
+    
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_tld_filter(tld_filter: str) -> FrozenSet[str]:
+    """
+    Parse a comma-separated watchlist TLD filter once.
+    
+    Args:
+        tld_filter: TLD filter from the watchlist
+        
+    Returns:
+        Set of lowercase TLD names
+    """
+    return frozenset(t.strip().lower() for t in tld_filter.split(','))
+
+
+def _sld(domain: DroppedDomain) -> str:
+    """
+    Domain name without its TLD.
+    """
+    return domain.domain.split('.')[0] if '.' in domain.domain else domain.domain
+
+
+@lru_cache(maxsize=1024)
+def _build_watchlist_predicate(
+    domain_pattern: Optional[str],
+    tld_filter: Optional[str],
+    min_length: Optional[int],
+    max_length: Optional[int],
+    charset_filter: Optional[str],
+    min_quality_score: Optional[int]
+) -> Callable[[DroppedDomain], bool]:
+    """
+    Build a domain predicate containing only the checks a watchlist sets.
+    
+    Unset criteria leave no check behind, so matching a batch of drops
+    doesn't re-test every watchlist field for every domain. Keyed on the
+    criteria themselves, so an edited watchlist gets a new predicate.
+    
+    Returns:
+        Function returning True if a DroppedDomain matches
+    """
+    checks = []
+    
+    # Check domain pattern (regex); an invalid regex skips the check
+    if domain_pattern:
+        pattern_re = compile_domain_pattern(domain_pattern)
+        if pattern_re is not None:
+            checks.append(lambda domain: pattern_re.search(_sld(domain)) is not None)
+    
+    # Check TLD filter
+    if tld_filter:
+        tlds = _parse_tld_filter(tld_filter)
+        checks.append(lambda domain: (domain.tld.name.lower() if domain.tld else "") in tlds)
+    
+    # Check length filter
+    if min_length:
+        checks.append(lambda domain: domain.length >= min_length)
+    if max_length:
+        checks.append(lambda domain: domain.length <= max_length)
+    
+    # Check charset filter against the stored charset_type, which comes from
+    # the same isalpha/isdigit checks on the SLD; "mixed" there also covers
+    # hyphenated names, which this filter excludes
+    if charset_filter in ("letters", "numbers"):
+        checks.append(lambda domain: domain.charset_type == charset_filter)
+    elif charset_filter == "mixed":
+        checks.append(lambda domain: domain.charset_type == "mixed" and "-" not in _sld(domain))
+    
+    # Check quality score filter; unscored domains pass
+    if min_quality_score:
+        checks.append(lambda domain: not domain.quality_score or domain.quality_score >= min_quality_score)
+    
+    if not checks:
+        return lambda domain: True
+    if len(checks) == 1:
+        return checks[0]
+    
+    def matches(domain: DroppedDomain) -> bool:
+        for check in checks:
+            if not check(domain):
+                return False
+        return True
+    
+    return matches
+
+
+def _watchlist_predicate(watchlist: UserWatchlist) -> Callable[[DroppedDomain], bool]:
+    """
+    Cached domain predicate for a watchlist's current criteria.
+    """
+    return _build_watchlist_predicate(
+        watchlist.domain_pattern,
+        watchlist.tld_filter,
+        watchlist.min_length,
+        watchlist.max_length,
+        watchlist.charset_filter,
+        watchlist.min_quality_score
+    )
+
+
 class WatchlistMatcher:
     """Service for matching dropped domains against user watchlists."""
     
@@ -55,8 +191,9 @@ class WatchlistMatcher:
         total_matched = 0
         
         for watchlist in watchlists:
+            matches_watchlist = _watchlist_predicate(watchlist)
             for domain in dropped_domains:
-                if self._matches_watchlist(domain, watchlist):
+                if matches_watchlist(domain):
                     matches.append({
                         "watchlist_id": watchlist.id,
                         "watchlist_name": watchlist.name,
@@ -91,47 +228,7 @@ class WatchlistMatcher:
         Returns:
             True if domain matches watchlist
         """
-        # Extract domain name (without TLD)
-        domain_name = domain.domain.split('.')[0] if '.' in domain.domain else domain.domain
-        
-        # Check domain pattern (regex)
-        if watchlist.domain_pattern:
-            try:
-                pattern = watchlist.domain_pattern.replace('*', '.*')  # Simple wildcard support
-                if not re.search(pattern, domain_name, re.IGNORECASE):
-                    return False
-            except re.error:
-                # Invalid regex, skip pattern check
-                pass
-        
-        # Check TLD filter
-        if watchlist.tld_filter:
-            tlds = [t.strip().lower() for t in watchlist.tld_filter.split(',')]
-            domain_tld = domain.tld.name.lower() if domain.tld else ""
-            if domain_tld not in tlds:
-                return False
-        
-        # Check length filter
-        if watchlist.min_length and domain.length < watchlist.min_length:
-            return False
-        if watchlist.max_length and domain.length > watchlist.max_length:
-            return False
-        
-        # Check charset filter
-        if watchlist.charset_filter:
-            if watchlist.charset_filter == "letters" and not domain_name.isalpha():
-                return False
-            elif watchlist.charset_filter == "numbers" and not domain_name.isdigit():
-                return False
-            elif watchlist.charset_filter == "mixed" and not (domain_name.isalnum() and not domain_name.isalpha() and not domain_name.isdigit()):
-                return False
-        
-        # Check quality score filter
-        if watchlist.min_quality_score and domain.quality_score:
-            if domain.quality_score < watchlist.min_quality_score:
-                return False
-        
-        return True
+        return _watchlist_predicate(watchlist)(domain)
     
     def _create_notifications(self, matches: List[Dict[str, Any]]):
         """
@@ -3,7 +3,7 @@ Zone file parser for extracting second-level domains.
 Enhanced with chunk-based processing for large files.
 """
 from pathlib import Path
-from typing import Set, Generator, Optional
+from typing import Set, Generator, Iterator, Optional
 import time
 
 
@@ -86,17 +86,19 @@ def extract_slds_from_zone_chunked(
         yield slds
 
 
-def extract_slds_from_zone(zone_path: Path, tld: str) -> Set[str]:
+def iter_slds_from_zone(zone_path: Path, tld: str) -> Iterator[str]:
     """
-    Parse a zone file and extract unique second-level domains (SLDs).
-    For large files, consider using extract_slds_from_zone_chunked instead.
+    Stream second-level domains (SLDs) from a zone file, one record at a time.
+    
+    A zone file lists several records per domain, so the same SLD can be
+    yielded more than once; callers that need unique values deduplicate.
     
     Args:
         zone_path: Path to the zone file
         tld: Top-level domain (e.g., "zip")
         
-    Returns:
-        Set of SLD strings (e.g., {"example", "test", "cool-name"})
+    Yields:
+        SLD strings (e.g., "example")
         
     Raises:
         FileNotFoundError: If zone file doesn't exist
@@ -104,7 +106,6 @@ def extract_slds_from_zone(zone_path: Path, tld: str) -> Set[str]:
     if not zone_path.exists():
         raise FileNotFoundError(f"Zone file not found: {zone_path}")
     
-    slds: Set[str] = set()
     tld_lower = tld.lower()
     tld_with_dot = f".{tld_lower}"
     
@@ -142,11 +143,31 @@ def extract_slds_from_zone(zone_path: Path, tld: str) -> Set[str]:
                 # Take the label before TLD as SLD
                 if len(domain_parts) >= 2:
                     sld = domain_parts[-2]
-                    # Filter out empty strings and add to set
+                    # Filter out empty strings
                     if sld:
-                        slds.add(sld)
+                        yield sld
+
+
+def extract_slds_from_zone(zone_path: Path, tld: str) -> Set[str]:
+    """
+    Parse a zone file and extract unique second-level domains (SLDs).
+    For large files, consider using extract_slds_from_zone_chunked instead.
+    
+    Args:
+        zone_path: Path to the zone file
+        tld: Top-level domain (e.g., "zip")
+        
+    Returns:
+        Set of SLD strings (e.g., {"example", "test", "cool-name"})
+        
+    Raises:
+        FileNotFoundError: If zone file doesn't exist
+    """
+    # Checked here so the error is raised on call, not on first iteration
+    if not zone_path.exists():
+        raise FileNotFoundError(f"Zone file not found: {zone_path}")
     
-    return slds
+    return set(iter_slds_from_zone(zone_path, tld))
 
 
 def build_domain_name(sld: str, tld: str) -> str:
@@ -2,15 +2,14 @@
 Admin panel routes for CZDS management.
 """
 from fastapi import APIRouter, Depends, Request, Form
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi import status
 
 from app.services.czds_client import CZDSClient
 from app.core.config import get_settings
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/admin", response_class=HTMLResponse)
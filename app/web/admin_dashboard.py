@@ -4,7 +4,6 @@ SaaS Admin Dashboard - Comprehensive management panel.
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, Request, HTTPException, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
@@ -16,9 +15,9 @@ from app.models.drop import DroppedDomain
 from app.models.tld import Tld
 from app.models.notification import Notification
 from app.web.auth_web import get_current_user_from_cookie
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 def require_admin(request: Request, db: Session = Depends(get_db)):
@@ -277,32 +276,48 @@ def admin_analytics(
     """
     Analytics and reporting page.
     """
-    # Revenue over time (last 30 days)
-    revenue_data = []
-    for i in range(30):
-        date = datetime.utcnow().date() - timedelta(days=29-i)
-        revenue = db.query(func.sum(Payment.amount)).filter(
+    # Last 30 days, oldest first; each series is one grouped query keyed by day
+    today = datetime.utcnow().date()
+    days = [today - timedelta(days=29 - i) for i in range(30)]
+    since = datetime.combine(days[0], datetime.min.time())
+    
+    # func.date() comes back as a date on MySQL and a string on SQLite, so key by str
+    payment_day = func.date(Payment.created_at)
+    revenue_by_day = {
+        str(day): total
+        for day, total in db.query(payment_day, func.sum(Payment.amount)).filter(
             and_(
                 Payment.status == "succeeded",
-                func.date(Payment.created_at) == date
+                Payment.created_at >= since
             )
-        ).scalar() or 0
-        revenue_data.append({
-            "date": date.isoformat(),
-            "revenue": float(revenue)
-        })
+        ).group_by(payment_day).all()
+    }
+    
+    user_day = func.date(User.created_at)
+    users_by_day = {
+        str(day): count
+        for day, count in db.query(user_day, func.count(User.id)).filter(
+            User.created_at >= since
+        ).group_by(user_day).all()
+    }
+    
+    # Revenue over time (last 30 days)
+    revenue_data = [
+        {
+            "date": day.isoformat(),
+            "revenue": float(revenue_by_day.get(str(day)) or 0)
+        }
+        for day in days
+    ]
     
     # User growth (last 30 days)
-    user_growth = []
-    for i in range(30):
-        date = datetime.utcnow().date() - timedelta(days=29-i)
-        count = db.query(func.count(User.id)).filter(
-            func.date(User.created_at) == date
-        ).scalar() or 0
-        user_growth.append({
-            "date": date.isoformat(),
-            "count": count
-        })
+    user_growth = [
+        {
+            "date": day.isoformat(),
+            "count": users_by_day.get(str(day), 0)
+        }
+        for day in days
+    ]
     
     # Subscription churn
     canceled_this_month = db.query(func.count(UserSubscription.id)).filter(
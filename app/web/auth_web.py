@@ -2,14 +2,15 @@
 Web routes for authentication pages.
 Handles login, register, and dashboard pages.
 """
-from typing import Optional
+from typing import Dict, NamedTuple, Optional
 from fastapi import APIRouter, Depends, Request, Form, HTTPException, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.models.user import User, UserWatchlist, UserFavorite
+from app.models.drop import DroppedDomain
+from app.models.tld import Tld
 from app.models.auth_token import EmailVerificationToken, PasswordResetToken
 from app.services.auth_service import (
     create_user, authenticate_user, get_user_by_id, get_user_by_email,
@@ -19,19 +20,57 @@ from app.services.auth_service import (
 from app.services.email_service import EmailService
 from app.services.subscription_service import SubscriptionService, get_subscription_service
 from app.models.subscription import ApiKey
+from app.web.templating import templates
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import func, select
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
+# Shared settings for the access token cookie set on login/register
+COOKIE_KWARGS = {
+    "key": "access_token",
+    "httponly": True,
+    "max_age": ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    "samesite": "lax"
+}
 
-def get_current_user_from_cookie(request: Request, db: Session) -> Optional[User]:
+
+# Full tracebacks for a given dashboard error type are logged at most this often
+TRACEBACK_LOG_INTERVAL_SECONDS = 10.0
+_last_traceback_logged: Dict[str, float] = {}
+
+
+def _log_dashboard_error(e: Exception) -> None:
     """
-    Get current user from cookie token.
+    Log a dashboard error, formatting the traceback at most once per interval
+    per exception type so a failing dependency (e.g. DB outage) stays cheap.
+    """
+    key = type(e).__name__
+    now = time.monotonic()
+    last = _last_traceback_logged.get(key)
+    
+    if last is None or now - last >= TRACEBACK_LOG_INTERVAL_SECONDS:
+        _last_traceback_logged[key] = now
+        logger.error("Dashboard error: %s", e, exc_info=True)
+    else:
+        logger.error("Dashboard error: %s", e)
+
+
+class UserRef(NamedTuple):
+    """Lightweight user reference built from the JWT payload (no DB access)."""
+    id: int
+    email: Optional[str]
+    username: Optional[str]
+    is_active: bool = True
+
+
+def _get_cookie_payload(request: Request) -> Optional[dict]:
+    """
+    Decode the access token cookie and return its payload.
     """
     token = request.cookies.get("access_token")
     
@@ -44,14 +83,41 @@ def get_current_user_from_cookie(request: Request, db: Session) -> Optional[User
     
     payload = decode_access_token(token)
     
+    if not payload or not payload.get("user_id"):
+        return None
+    
+    return payload
+
+
+def get_current_user_ref(request: Request) -> Optional[UserRef]:
+    """
+    Get a reference to the current user from the signed cookie only.
+    
+    Use this for routes that only need to know whether someone is logged in;
+    routes that need fresh user data must use get_current_user_from_cookie.
+    """
+    payload = _get_cookie_payload(request)
+    
     if not payload:
         return None
     
-    user_id = payload.get("user_id")
-    if not user_id:
+    return UserRef(
+        id=payload["user_id"],
+        email=payload.get("email"),
+        username=payload.get("username")
+    )
+
+
+def get_current_user_from_cookie(request: Request, db: Session) -> Optional[User]:
+    """
+    Get current user from cookie token.
+    """
+    payload = _get_cookie_payload(request)
+    
+    if not payload:
         return None
     
-    user = get_user_by_id(db, user_id)
+    user = get_user_by_id(db, payload["user_id"])
     
     if not user or not user.is_active:
         return None
@@ -59,20 +125,60 @@ def get_current_user_from_cookie(request: Request, db: Session) -> Optional[User
     return user
 
 
-@router.get("/login", response_class=HTMLResponse)
-def login_page(request: Request, db: Session = Depends(get_db)):
+def _favorites_select(user_id: int):
     """
-    Login page.
+    Build a Core SELECT of a user's favorites joined with their domain data.
+    
+    The pages only render these rows, so plain Row tuples (addressable by
+    label in Jinja) are returned instead of hydrated ORM objects.
     """
-    # Check if already logged in
-    user = get_current_user_from_cookie(request, db)
-    if user:
+    return select(
+        UserFavorite.id,
+        UserFavorite.domain_id,
+        UserFavorite.notes,
+        UserFavorite.created_at,
+        DroppedDomain.domain,
+        DroppedDomain.drop_date,
+        DroppedDomain.length,
+        DroppedDomain.charset_type,
+        func.coalesce(Tld.name, "").label("tld")
+    ).join(
+        DroppedDomain, DroppedDomain.id == UserFavorite.domain_id
+    ).outerjoin(
+        Tld, Tld.id == DroppedDomain.tld_id
+    ).where(
+        UserFavorite.user_id == user_id
+    ).order_by(UserFavorite.created_at.desc())
+
+
+def _auth_form_page(request: Request, db: Session, template_name: str):
+    """
+    Render the login/register form, or redirect a logged-in user to the dashboard.
+    
+    The database is only consulted when a valid-looking cookie is present.
+    If that cookie belongs to a deactivated or deleted user it is cleared,
+    so the form stays reachable instead of bouncing through /dashboard.
+    """
+    has_token = get_current_user_ref(request) is not None
+    if has_token and get_current_user_from_cookie(request, db):
         return RedirectResponse(url="/dashboard", status_code=302)
     
-    return templates.TemplateResponse("auth/login.html", {
+    response = templates.TemplateResponse(template_name, {
         "request": request,
         "error": None
     })
+    if has_token:
+        # Signed token, but the user is gone or deactivated
+        response.delete_cookie(key="access_token")
+    return response
+
+
+@router.get("/login", response_class=HTMLResponse)
+def login_page(request: Request, db: Session = Depends(get_db)):
+    """
+    Login page.
+    """
+    return _auth_form_page(request, db, "auth/login.html")
 
 
 @router.post("/login", response_class=HTMLResponse)
@@ -104,13 +210,7 @@ def login_submit(
     
     # Redirect to dashboard with cookie
     response = RedirectResponse(url="/dashboard", status_code=302)
-    response.set_cookie(
-        key="access_token",
-        value=f"Bearer {access_token}",
-        httponly=True,
-        max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        samesite="lax"
-    )
+    response.set_cookie(value=f"Bearer {access_token}", **COOKIE_KWARGS)
     
     return response
 
@@ -120,15 +220,7 @@ def register_page(request: Request, db: Session = Depends(get_db)):
     """
     Registration page.
     """
-    # Check if already logged in
-    user = get_current_user_from_cookie(request, db)
-    if user:
-        return RedirectResponse(url="/dashboard", status_code=302)
-    
-    return templates.TemplateResponse("auth/register.html", {
-        "request": request,
-        "error": None
-    })
+    return _auth_form_page(request, db, "auth/register.html")
 
 
 @router.post("/register", response_class=HTMLResponse)
@@ -190,13 +282,7 @@ def register_submit(
     
     # Redirect to dashboard with cookie
     response = RedirectResponse(url="/dashboard", status_code=302)
-    response.set_cookie(
-        key="access_token",
-        value=f"Bearer {access_token}",
-        httponly=True,
-        max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        samesite="lax"
-    )
+    response.set_cookie(value=f"Bearer {access_token}", **COOKIE_KWARGS)
     
     return response
 
@@ -236,25 +322,8 @@ def dashboard_page(request: Request, db: Session = Depends(get_db)):
             UserWatchlist.user_id == user.id
         ).order_by(UserWatchlist.created_at.desc()).limit(5).all()
         
-        # Get recent favorites with domain info
-        from app.models.drop import DroppedDomain
-        recent_favorites = db.query(UserFavorite).filter(
-            UserFavorite.user_id == user.id
-        ).order_by(UserFavorite.created_at.desc()).limit(10).all()
-        
-        # Enrich favorites with domain data
-        favorites_data = []
-        for fav in recent_favorites:
-            domain = db.query(DroppedDomain).filter(DroppedDomain.id == fav.domain_id).first()
-            if domain:
-                favorites_data.append({
-                    "id": fav.id,
-                    "domain": domain.domain,
-                    "tld": domain.tld.name if domain.tld else "",
-                    "drop_date": domain.drop_date,
-                    "notes": fav.notes,
-                    "created_at": fav.created_at
-                })
+        # Get recent favorites with domain info (read-only rows, one query)
+        favorites_data = db.execute(_favorites_select(user.id).limit(10)).all()
         
         # Get subscription info
         subscription_service = get_subscription_service(db)
@@ -297,7 +366,7 @@ def dashboard_page(request: Request, db: Session = Depends(get_db)):
         
         return templates.TemplateResponse("auth/dashboard.html", context)
     except Exception as e:
-        logger.error(f"Dashboard error: {e}", exc_info=True)
+        _log_dashboard_error(e)
         # Return simple error message
         from fastapi.responses import PlainTextResponse
         return PlainTextResponse(
@@ -358,28 +427,8 @@ def favorites_page(request: Request, db: Session = Depends(get_db)):
     if not user:
         return RedirectResponse(url="/login", status_code=302)
     
-    from app.models.drop import DroppedDomain
-    
-    favorites = db.query(UserFavorite).filter(
-        UserFavorite.user_id == user.id
-    ).order_by(UserFavorite.created_at.desc()).all()
-    
-    # Enrich with domain data
-    favorites_data = []
-    for fav in favorites:
-        domain = db.query(DroppedDomain).filter(DroppedDomain.id == fav.domain_id).first()
-        if domain:
-            favorites_data.append({
-                "id": fav.id,
-                "domain_id": fav.domain_id,
-                "domain": domain.domain,
-                "tld": domain.tld.name if domain.tld else "",
-                "drop_date": domain.drop_date,
-                "length": domain.length,
-                "charset_type": domain.charset_type,
-                "notes": fav.notes,
-                "created_at": fav.created_at
-            })
+    # Favorites joined with their domain data as read-only rows
+    favorites_data = db.execute(_favorites_select(user.id)).all()
     
     return templates.TemplateResponse("auth/favorites.html", {
         "request": request,
@@ -569,8 +618,7 @@ def forgot_password_submit(
             email_service = EmailService(db)
             email_service.send_password_reset_email(user, token)
         except Exception as e:
-            import logging
-            logging.error(f"Failed to send password reset email: {e}")
+            logger.error(f"Failed to send password reset email: {e}")
     
     # Always return success to prevent email enumeration
     return templates.TemplateResponse("auth/forgot_password.html", {
@@ -644,8 +692,7 @@ def resend_verification_submit(
             "message": "Doğrulama emaili gönderildi. Lütfen email kutunuzu kontrol edin."
         })
     except Exception as e:
-        import logging
-        logging.error(f"Failed to send verification email: {e}")
+        logger.error(f"Failed to send verification email: {e}")
         return templates.TemplateResponse("auth/resend_verification.html", {
             "request": request,
             "user": user,
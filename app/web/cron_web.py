@@ -2,15 +2,23 @@
 Web routes for Cron Jobs management page.
 """
 from fastapi import APIRouter, Request, Depends
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.tld_cache import get_active_tlds
+from app.models.cron_job import CronJob
 from app.services.cron_job_service import CronJobService
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Columns rendered by the admin/cron_jobs.html job table
+LISTING_COLUMNS = [
+    CronJob.id, CronJob.tld, CronJob.cron_hour, CronJob.cron_minute,
+    CronJob.last_run_at, CronJob.next_run_at, CronJob.last_status,
+    CronJob.is_enabled, CronJob.total_runs, CronJob.success_count
+]
 
 
 @router.get("/admin/cron", response_class=HTMLResponse)
@@ -20,22 +28,21 @@ def cron_jobs_page(request: Request, db: Session = Depends(get_db)):
     """
     service = CronJobService(db)
     
-    # Get jobs and stats
-    jobs, total = service.get_all(limit=200)
-    scheduler_status = service.get_scheduler_status()
+    # Get jobs (only the columns the listing renders) and stats
+    jobs, total = service.get_all(limit=200, columns=LISTING_COLUMNS)
+    job_stats = service.get_job_stats()
+    scheduler_status = service.get_scheduler_status(job_stats)
     
-    # Calculate stats
-    enabled_count = service.get_enabled_count()
-    running_count = service.get_running_count()
+    enabled_count = job_stats["enabled_count"]
+    running_count = job_stats["running_count"]
     
-    # Calculate success rate
-    total_runs = sum(job.total_runs for job in jobs)
-    success_runs = sum(job.success_count for job in jobs)
+    # Calculate success rate over all jobs
+    total_runs = job_stats["total_runs"]
+    success_runs = job_stats["success_runs"]
     success_rate = (success_runs / total_runs * 100) if total_runs > 0 else 0
     
     # Get TLDs for dropdown (from existing TLD table)
-    from app.models.tld import Tld
-    tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
+    tlds = get_active_tlds(db)
     
     return templates.TemplateResponse("admin/cron_jobs.html", {
         "request": request,
@@ -1,28 +1,179 @@
 """
 Debug/Test page for checking download, parse, and database status.
 """
+import logging
+import os
+from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
-from fastapi import APIRouter, Depends, Request
-from fastapi.templating import Jinja2Templates
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, desc, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from app.core.database import get_db
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.drop_cache import get_drop_counts
 from app.models.tld import Tld
 from app.models.drop import DroppedDomain
+from app.web.templating import templates
 # from app.services.zone_parser import extract_slds_from_zone  # Not used in debug page to avoid timeout
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
-@router.get("/debug", response_class=HTMLResponse)
-def debug_page(request: Request, db: Session = Depends(get_db)):
+ZONE_SUFFIX = ".zone"
+
+# The grand total only feeds a dashboard number; refresh it at most once a minute
+TOTAL_DROPS_TTL_SECONDS = 60
+_total_drops_cache = TTLCache(TOTAL_DROPS_TTL_SECONDS)
+
+# The page only changes when an import runs; serve refreshes from memory
+DEBUG_STATUS_TTL_SECONDS = 30
+_debug_status_cache = TTLCache(DEBUG_STATUS_TTL_SECONDS)
+
+
+@dataclass(slots=True)
+class ZoneFileInfo:
     """
-    Debug page showing download, parse, and database status.
+    One zone file row on the debug page.
+    
+    Slotted so each row is a fixed-layout object instead of a per-file dict;
+    Jinja reads the attributes exactly as it read the dict keys.
+    """
+    path: str
+    name: str
+    size: int = 0
+    size_mb: float = 0.0
+    date: Optional[str] = None
+    sld_count: Union[int, str, None] = None
+    is_parsed: bool = False
+    error: Optional[str] = None
+
+
+def _scan_zone_files(tld_dir) -> List[os.DirEntry]:
+    """
+    List the zone files in a TLD directory, newest (YYYYMMDD name) first.
+    
+    os.scandir returns DirEntry objects whose type and stat information come
+    from the directory read itself, avoiding a Path object and extra stat
+    call per file.
+    """
+    try:
+        with os.scandir(tld_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith(ZONE_SUFFIX) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    
+    entries.sort(key=lambda entry: entry.name, reverse=True)
+    return entries
+
+
+def _parse_zone_date(file_date_str: str) -> Optional[date]:
+    """
+    Parse a YYYYMMDD zone file name into a date, or None if it isn't one.
+    
+    Non-numeric names are rejected with a cheap check up front, so only
+    digit strings that are not a real calendar date reach the except.
+    """
+    if len(file_date_str) != 8 or not file_date_str.isdigit():
+        return None
+    try:
+        return date(int(file_date_str[:4]), int(file_date_str[4:6]), int(file_date_str[6:8]))
+    except ValueError:
+        return None
+
+
+def _count_total_drops(db: Session) -> int:
+    """
+    Row count of dropped_domains, from table statistics where the database keeps them.
+    
+    MySQL (InnoDB) and PostgreSQL expose an estimated row count that is an O(1)
+    metadata lookup, unlike COUNT(*) which scans an index of the whole table.
+    Other databases, or missing statistics, fall back to an exact count.
+    """
+    table_name = DroppedDomain.__tablename__
+    dialect = db.get_bind().dialect.name
+    
+    estimate = None
+    if dialect == "mysql":
+        estimate = db.execute(text(
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = :name"
+        ), {"name": table_name}).scalar()
+    elif dialect == "postgresql":
+        estimate = db.execute(text(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = :name"
+        ), {"name": table_name}).scalar()
+    
+    # PostgreSQL reports -1 for tables that have never been analyzed
+    if estimate is not None and estimate >= 0:
+        return int(estimate)
+    return db.query(func.count(DroppedDomain.id)).scalar() or 0
+
+
+def _get_total_drops(db: Session) -> int:
+    """
+    Approximate total drop count, cached for TOTAL_DROPS_TTL_SECONDS.
+    """
+    return _total_drops_cache.get_or_set("total", lambda: _count_total_drops(db))
+
+
+def _get_recent_drops(db: Session, limit: int = 50) -> list:
+    """
+    Get the most recent drops, sampled across active imported TLDs for variety.
+    
+    Uses a single ROW_NUMBER() window query instead of one query per TLD; on
+    databases without window functions (MySQL < 8) it falls back to the latest
+    drops overall.
+    """
+    tld_filter = (Tld.is_active == True, Tld.last_import_date != None)
+    
+    tld_count = db.query(func.count(Tld.id)).filter(*tld_filter).scalar() or 0
+    drops_per_tld = max(5, limit // max(tld_count, 1))
+    
+    try:
+        rn = func.row_number().over(
+            partition_by=DroppedDomain.tld_id,
+            order_by=desc(DroppedDomain.created_at)
+        ).label("rn")
+        ranked = db.query(DroppedDomain.id.label("id"), rn).join(Tld).filter(
+            *tld_filter
+        ).subquery()
+        
+        return db.query(DroppedDomain).options(
+            joinedload(DroppedDomain.tld)
+        ).join(
+            ranked, ranked.c.id == DroppedDomain.id
+        ).filter(
+            ranked.c.rn <= drops_per_tld
+        ).order_by(desc(DroppedDomain.created_at)).limit(limit).all()
+    # MySQL < 8 rejects OVER as a syntax error (1064), which the driver
+    # raises as ProgrammingError; other backends report OperationalError
+    except (OperationalError, ProgrammingError):
+        db.rollback()
+        return db.query(DroppedDomain).options(
+            joinedload(DroppedDomain.tld)
+        ).order_by(desc(DroppedDomain.created_at)).limit(limit).all()
+
+
+def build_debug_status(db: Session) -> dict:
+    """
+    Collect download, parse, and database status for the debug page.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Status dictionary rendered by debug.html
     """
     try:
         settings = get_settings()
@@ -42,68 +193,67 @@ def debug_page(request: Request, db: Session = Depends(get_db)):
             "errors": []
         }
     except Exception as e:
-        # If initialization fails, return error page
-        return templates.TemplateResponse("debug.html", {
-            "request": request,
-            "status": {
-                "data_dir_exists": False,
-                "data_dir_path": "Unknown",
-                "zones_dir_exists": False,
-                "zones_dir_path": "Unknown",
-                "tlds": [],
-                "zone_files": [],
-                "db_stats": {},
-                "recent_drops": [],
-                "errors": [f"Initialization error: {str(e)}"]
-            }
-        })
+        # If initialization fails, return error status
+        return {
+            "data_dir_exists": False,
+            "data_dir_path": "Unknown",
+            "zones_dir_exists": False,
+            "zones_dir_path": "Unknown",
+            "tlds": [],
+            "zone_files": [],
+            "db_stats": {},
+            "recent_drops": [],
+            "errors": [f"Initialization error: {str(e)}"]
+        }
     
     # Check zone files directly from filesystem (even if DB is not available)
     zone_files_found = {}
     if zones_dir.exists():
-        for tld_dir in zones_dir.iterdir():
-            if tld_dir.is_dir():
-                tld_name = tld_dir.name
-                zone_files = sorted(tld_dir.glob("*.zone"), reverse=True)
-                if zone_files:
-                    zone_files_found[tld_name] = []
-                    for zone_file in zone_files[:10]:  # Last 10 files
-                        try:
-                            file_size = zone_file.stat().st_size
-                            file_date_str = zone_file.stem  # YYYYMMDD
-                            try:
-                                file_date = date(
-                                    int(file_date_str[:4]),
-                                    int(file_date_str[4:6]),
-                                    int(file_date_str[6:8])
-                                )
-                            except:
-                                file_date = None
-                            
-                            # Don't parse zone files in debug page (too slow)
-                            # Parse can be done via API endpoint /api/v1/import/all-zones
-                            sld_count = "Not parsed (use import API)"
-                            
-                            zone_files_found[tld_name].append({
-                                "path": str(zone_file),
-                                "name": zone_file.name,
-                                "size": file_size,
-                                "size_mb": round(file_size / (1024 * 1024), 2),
-                                "date": file_date.isoformat() if file_date else None,
-                                "sld_count": sld_count
-                            })
-                        except Exception as e:
-                            zone_files_found[tld_name].append({
-                                "path": str(zone_file),
-                                "name": zone_file.name,
-                                "error": str(e)[:100]
-                            })
+        with os.scandir(zones_dir) as it:
+            tld_dirs = [entry for entry in it if entry.is_dir()]
+        for tld_dir in tld_dirs:
+            tld_name = tld_dir.name
+            zone_files = _scan_zone_files(tld_dir.path)
+            if zone_files:
+                zone_files_found[tld_name] = []
+                for zone_file in zone_files[:10]:  # Last 10 files
+                    try:
+                        file_size = zone_file.stat().st_size
+                    except OSError as e:
+                        zone_files_found[tld_name].append(ZoneFileInfo(
+                            path=zone_file.path,
+                            name=zone_file.name,
+                            error=str(e)[:100]
+                        ))
+                        continue
+                    
+                    file_date = _parse_zone_date(zone_file.name[:-len(ZONE_SUFFIX)])
+                    
+                    # Don't parse zone files in debug page (too slow)
+                    # Parse can be done via API endpoint /api/v1/import/all-zones
+                    sld_count = "Not parsed (use import API)"
+                    
+                    zone_files_found[tld_name].append(ZoneFileInfo(
+                        path=zone_file.path,
+                        name=zone_file.name,
+                        size=file_size,
+                        size_mb=round(file_size / (1024 * 1024), 2),
+                        date=file_date.isoformat() if file_date else None,
+                        sld_count=sld_count
+                    ))
     
     # Check TLDs and zone files from database (if available)
     db_available = True
     try:
         # Limit query to avoid timeout
         tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).limit(20).all()
+        tld_ids = [t.id for t in tlds]
+        
+        # Per-TLD/date counts come from the shared rollup instead of one query per TLD/zone file
+        counts_by_date = get_drop_counts(db)
+        total_by_tld = {}
+        for (tld_id, _), count in counts_by_date.items():
+            total_by_tld[tld_id] = total_by_tld.get(tld_id, 0) + count
         
         for tld in tlds:
             tld_info = {
@@ -116,62 +266,49 @@ def debug_page(request: Request, db: Session = Depends(get_db)):
             }
             
             # Check zone files for this TLD
-            tld_zones_dir = zones_dir / tld.name.lower()
-            if tld_zones_dir.exists():
-                zone_files = sorted(tld_zones_dir.glob("*.zone"), reverse=True)
+            zone_files = _scan_zone_files(zones_dir / tld.name.lower())
+            if zone_files:
                 for zone_file in zone_files[:10]:  # Last 10 files
                     try:
                         file_size = zone_file.stat().st_size
-                        file_date_str = zone_file.stem  # YYYYMMDD
-                        try:
-                            file_date = date(
-                                int(file_date_str[:4]),
-                                int(file_date_str[4:6]),
-                                int(file_date_str[6:8])
-                            )
-                        except:
-                            file_date = None
+                    except OSError as e:
+                        tld_info["zone_files"].append(ZoneFileInfo(
+                            path=zone_file.path,
+                            name=zone_file.name,
+                            error=str(e)[:100]
+                        ))
+                        continue
+                    
+                    file_date = _parse_zone_date(zone_file.name[:-len(ZONE_SUFFIX)])
+                    
+                    # Check if this zone file has been parsed by looking at DB records
+                    sld_count = "Not parsed (use import API)"
+                    is_parsed = False
+                    
+                    if file_date:
+                        # Check if there are any dropped domains for this date and TLD
+                        domain_count = counts_by_date.get((tld.id, file_date), 0)
                         
-                        # Check if this zone file has been parsed by looking at DB records
-                        sld_count = "Not parsed (use import API)"
-                        is_parsed = False
-                        
-                        if file_date:
-                            # Check if there are any dropped domains for this date and TLD
-                            domain_count = db.query(func.count(DroppedDomain.id)).filter(
-                                DroppedDomain.tld_id == tld.id,
-                                DroppedDomain.drop_date == file_date
-                            ).scalar()
-                            
-                            if domain_count and domain_count > 0:
-                                sld_count = domain_count
-                                is_parsed = True
-                            elif tld.last_import_date and tld.last_import_date >= file_date:
-                                # TLD was imported on or after this date, might have 0 drops
-                                sld_count = 0
-                                is_parsed = True
-                        
-                        tld_info["zone_files"].append({
-                            "path": str(zone_file),
-                            "name": zone_file.name,
-                            "size": file_size,
-                            "size_mb": round(file_size / (1024 * 1024), 2),
-                            "date": file_date.isoformat() if file_date else None,
-                            "sld_count": sld_count,
-                            "is_parsed": is_parsed
-                        })
-                    except Exception as e:
-                        tld_info["zone_files"].append({
-                            "path": str(zone_file),
-                            "name": zone_file.name,
-                            "error": str(e)[:100]
-                        })
+                        if domain_count and domain_count > 0:
+                            sld_count = domain_count
+                            is_parsed = True
+                        elif tld.last_import_date and tld.last_import_date >= file_date:
+                            # TLD was imported on or after this date, might have 0 drops
+                            sld_count = 0
+                            is_parsed = True
+                    
+                    tld_info["zone_files"].append(ZoneFileInfo(
+                        path=zone_file.path,
+                        name=zone_file.name,
+                        size=file_size,
+                        size_mb=round(file_size / (1024 * 1024), 2),
+                        date=file_date.isoformat() if file_date else None,
+                        sld_count=sld_count,
+                        is_parsed=is_parsed
+                    ))
             
             # Count drops for this TLD
-            drop_count = db.query(func.count(DroppedDomain.id)).filter(
-                DroppedDomain.tld_id == tld.id
-            ).scalar()
-            tld_info["drop_count"] = drop_count
+            tld_info["drop_count"] = total_by_tld.get(tld.id, 0)
             
             status["tlds"].append(tld_info)
     except Exception as e:
@@ -195,44 +332,27 @@ def debug_page(request: Request, db: Session = Depends(get_db)):
     status["db_available"] = db_available
     if db_available:
         try:
-            total_drops = db.query(func.count(DroppedDomain.id)).scalar()
-            latest_drop_date = db.query(func.max(DroppedDomain.drop_date)).scalar()
-            earliest_drop_date = db.query(func.min(DroppedDomain.drop_date)).scalar()
+            total_drops = _get_total_drops(db)
+            
+            # Daily totals across TLDs, from the shared rollup
+            counts_by_day = {}
+            for (_, drop_date), count in get_drop_counts(db).items():
+                counts_by_day[drop_date] = counts_by_day.get(drop_date, 0) + count
+            latest_drop_date = max(counts_by_day, default=None)
+            earliest_drop_date = min(counts_by_day, default=None)
             
             # Drops by date (last 7 days)
             drops_by_date = []
             if latest_drop_date:
                 for i in range(7):
                     check_date = latest_drop_date - timedelta(days=i)
-                    count = db.query(func.count(DroppedDomain.id)).filter(
-                        DroppedDomain.drop_date == check_date
-                    ).scalar()
                     drops_by_date.append({
                         "date": check_date.isoformat(),
-                        "count": count
+                        "count": counts_by_day.get(check_date, 0)
                     })
             
             # Recent drops - get samples from each TLD
-            recent_drops = []
-            
-            # Get all active TLDs that have drops
-            tlds_with_drops = db.query(Tld).filter(
-                Tld.is_active == True,
-                Tld.last_import_date != None
-            ).all()
-            
-            # Get recent drops from each TLD (limit per TLD to get variety)
-            drops_per_tld = max(5, 50 // max(len(tlds_with_drops), 1))
-            
-            for tld_item in tlds_with_drops:
-                tld_drops = db.query(DroppedDomain).filter(
-                    DroppedDomain.tld_id == tld_item.id
-                ).order_by(desc(DroppedDomain.created_at)).limit(drops_per_tld).all()
-                recent_drops.extend(tld_drops)
-            
-            # Sort all by created_at and limit to 50
-            recent_drops.sort(key=lambda x: x.created_at or x.drop_date, reverse=True)
-            recent_drops = recent_drops[:50]
+            recent_drops = _get_recent_drops(db)
             
             status["db_stats"] = {
                 "total_drops": total_drops,
@@ -272,16 +392,34 @@ def debug_page(request: Request, db: Session = Depends(get_db)):
         }
         status["recent_drops"] = []
     
+    return status
+
+
+@router.get("/debug", response_class=HTMLResponse)
+def debug_page(
+    request: Request,
+    refresh: bool = Query(False, description="Bypass the cached status"),
+    db: Session = Depends(get_db)
+):
+    """
+    Debug page showing download, parse, and database status.
+    """
+    if refresh:
+        _debug_status_cache.clear()
+    status = _debug_status_cache.get_or_set("status", lambda: build_debug_status(db))
+    
     try:
         return templates.TemplateResponse("debug.html", {
             "request": request,
             "status": status
         })
     except Exception as e:
-        # If template rendering fails, return simple error response
+        # If template rendering fails, log the status server-side and return a
+        # short error line instead of serializing the whole status dict
+        logger.error(f"Debug page render error, status: {status}", exc_info=True)
         from fastapi.responses import PlainTextResponse
         return PlainTextResponse(
-            f"Debug page error: {str(e)}\n\nStatus data: {status}",
+            f"Debug page error: {e.__class__.__name__}: {e}",
             status_code=500
         )
 
@@ -1,21 +1,26 @@
 """
 Web route for deleted domains page - shows last 7 days grouped by date.
 """
+import logging
 from datetime import date, timedelta
+from itertools import groupby
+from operator import attrgetter
 from typing import Dict, List
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, case
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import desc
 
 from app.core.database import get_db
-from app.models.tld import Tld
+from app.core.drop_cache import get_latest_drop_date
+from app.core.drop_rows import quality_score_desc
+from app.core.tld_cache import drop_tld_filter, get_active_tlds
 from app.models.drop import DroppedDomain
-from app.schemas.drop import DropRead
+from app.web.templating import stream_template
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/deleted-domains", response_class=HTMLResponse)
@@ -39,7 +44,7 @@ def deleted_domains_list(
     
     try:
         # Get all active TLDs for filter
-        active_tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
+        active_tlds = get_active_tlds(db)
         
         # Calculate date range (last N days)
         today = date.today()
@@ -55,7 +60,7 @@ def deleted_domains_list(
         # If no domains in range, use all available domains (or last 30 days from latest date)
         if count_in_range == 0:
             # Get the latest available date
-            latest_date = db.query(func.max(DroppedDomain.drop_date)).scalar()
+            latest_date = get_latest_drop_date(db)
             if latest_date:
                 # Show last 30 days from latest date, or all if less than 30 days
                 actual_start = latest_date - timedelta(days=min(30, days))
@@ -63,52 +68,52 @@ def deleted_domains_list(
                 end_date = latest_date
         
         # Build query for dropped domains in the date range
-        query = db.query(DroppedDomain).join(Tld).filter(
+        query = db.query(DroppedDomain).join(DroppedDomain.tld).options(
+            contains_eager(DroppedDomain.tld)
+        ).filter(
             DroppedDomain.drop_date >= start_date,
             DroppedDomain.drop_date <= end_date
         )
         
         # Apply TLD filter if specified
         if tld:
-            query = query.filter(Tld.name == tld.lower())
+            query = query.filter(drop_tld_filter(db, tld))
         
         # Get all domains ordered by date (newest first), then quality score, then domain name
         # Limit to prevent timeout on large datasets (max 5000 domains per request)
         all_domains = query.order_by(
             desc(DroppedDomain.drop_date),
-            case((DroppedDomain.quality_score.is_(None), 1), else_=0),
-            desc(DroppedDomain.quality_score),
+            quality_score_desc(db),  # Unscored domains last
             DroppedDomain.domain
         ).limit(5000).all()
         
-        # Group domains by date
-        for domain in all_domains:
-            drop_date = domain.drop_date
-            if drop_date not in domains_by_date:
-                domains_by_date[drop_date] = []
-                date_stats[drop_date] = 0
-            
-            domains_by_date[drop_date].append({
-                "id": domain.id,
-                "domain": domain.domain,
-                "tld": domain.tld.name if domain.tld else "unknown",
-                "drop_date": domain.drop_date,
-                "length": domain.length,
-                "charset_type": domain.charset_type,
-                "quality_score": domain.quality_score,
-                "label_count": domain.label_count if hasattr(domain, 'label_count') else None
-            })
-            date_stats[drop_date] += 1
+        # Group domains by date; rows are already ordered by drop_date (newest
+        # first), so consecutive runs are the groups
+        for drop_date, group in groupby(all_domains, key=attrgetter("drop_date")):
+            bucket = [
+                {
+                    "id": domain.id,
+                    "domain": domain.domain,
+                    "tld": domain.tld.name if domain.tld else "unknown",
+                    "drop_date": domain.drop_date,
+                    "length": domain.length,
+                    "charset_type": domain.charset_type,
+                    "quality_score": domain.quality_score,
+                    "label_count": domain.label_count
+                }
+                for domain in group
+            ]
+            domains_by_date[drop_date] = bucket
+            date_stats[drop_date] = len(bucket)
         
         # Calculate total
         total_domains = len(all_domains)
         
-        # Sort dates in descending order (newest first)
-        sorted_dates = sorted(domains_by_date.keys(), reverse=True)
+        # Dates were inserted newest first
+        sorted_dates = list(domains_by_date)
         
-    except Exception as e:
-        import logging
-        logging.error(f"Database error in deleted_domains_list route: {e}", exc_info=True)
+    except Exception:
+        logger.exception("Database error in deleted_domains_list route")
         sorted_dates = []
         domains_by_date = {}
         date_stats = {}
@@ -119,7 +124,9 @@ def deleted_domains_list(
         if 'end_date' not in locals():
             end_date = today
     
-    return templates.TemplateResponse("deleted_domains.html", {
+    # Stream the page: with up to 5000 rows the rendered HTML is large, so send
+    # it in chunks as the template loops instead of building it all in memory
+    return stream_template("deleted_domains.html", {
         "request": request,
         "active_tlds": active_tlds,
         "selected_tld": tld,
@@ -1,21 +1,96 @@
 """
 Web route for comprehensive domain listing page with pagination.
 """
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
 from datetime import date, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, case
+from sqlalchemy import func, desc, and_, select
 
-from app.core.database import get_db
-from app.models.tld import Tld
+from app.core.database import SessionLocal, get_db
+from app.core.drop_rows import quality_score_desc, select_drop_rows
+from app.core.tld_cache import drop_tld_filter, get_active_tlds
 from app.models.drop import DroppedDomain
-from app.schemas.drop import DropRead
+from app.web.pagination import compute_page_range
+from app.web.templating import stream_template, templates
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+
+# Runs independent listing queries next to the request's own; each job
+# opens its own session since sessions can't be shared across threads
+_QUERY_WORKERS = 4
+_query_executor = ThreadPoolExecutor(max_workers=_QUERY_WORKERS, thread_name_prefix="domains-query")
+
+# One slot per executor worker; when all are taken the query runs inline on
+# the request's session instead of queueing behind other requests' jobs
+_query_slots = BoundedSemaphore(_QUERY_WORKERS)
+
+
+def _load_future_drops(db: Session, selected_date: date, future_days: int, tld_clause=None) -> Tuple[list, int]:
+    """
+    Get up to 100 drops in the days after selected_date, with their total.
+    
+    Args:
+        db: Database session
+        selected_date: Date the listing is showing
+        future_days: Number of days after selected_date to include
+        tld_clause: Optional TLD filter clause from drop_tld_filter
+    
+    Returns:
+        Tuple of (rows, total)
+    """
+    future_date = selected_date + timedelta(days=future_days)
+    future_filters = [
+        and_(
+            DroppedDomain.drop_date > selected_date,
+            DroppedDomain.drop_date <= future_date
+        )
+    ]
+    
+    if tld_clause is not None:
+        future_filters.append(tld_clause)
+    
+    future_domains = db.execute(
+        select_drop_rows().where(*future_filters).order_by(
+            DroppedDomain.drop_date,
+            quality_score_desc(db),
+            DroppedDomain.domain
+        ).limit(101)
+    ).all()
+    
+    # Only count when the list was truncated; otherwise its length is the total
+    if len(future_domains) > 100:
+        future_domains = future_domains[:100]
+        total_future = db.execute(
+            select(func.count(DroppedDomain.id)).select_from(DroppedDomain).join(
+                DroppedDomain.tld
+            ).where(*future_filters)
+        ).scalar()
+    else:
+        total_future = len(future_domains)
+    
+    return future_domains, total_future
+
+
+def _load_future_drops_pooled(selected_date: date, future_days: int, tld_clause=None) -> Tuple[list, int]:
+    """
+    Run _load_future_drops on the executor with its own session.
+    
+    Releases the executor slot taken by the caller once done.
+    """
+    db = SessionLocal()
+    try:
+        return _load_future_drops(db, selected_date, future_days, tld_clause)
+    finally:
+        db.close()
+        _query_slots.release()
 
 
 @router.get("/domains", response_class=HTMLResponse)
@@ -26,6 +101,7 @@ def domains_list(
     future_days: int = Query(7, ge=1, le=30, description="Days to look ahead for future drops"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, description="Items per page (30, 50, 100, 200, or 500)"),
+    exact_count: bool = Query(False, description="Compute the exact total with a COUNT query"),
     db: Session = Depends(get_db)
 ):
     """
@@ -45,117 +121,102 @@ def domains_list(
     total_dropped = 0
     total_future = 0
     total_pages = 1
-    page_range = []
+    has_next = False
     
     try:
         # Get all active TLDs for filter
-        active_tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
+        active_tlds = get_active_tlds(db)
         
         # Determine date to show - default: show all domains
         if date_filter:
             selected_date = date_filter
         
+        # Resolve the TLD filter once for both the page and the future drops
+        tld_clause = drop_tld_filter(db, tld) if tld else None
+        
+        # Future drops (only when date is selected) don't depend on the page,
+        # so they're queried on a second connection while the page loads
+        future_job = None
+        if selected_date and _query_slots.acquire(blocking=False):
+            try:
+                future_job = _query_executor.submit(
+                    _load_future_drops_pooled, selected_date, future_days, tld_clause
+                )
+            except RuntimeError:
+                _query_slots.release()
+        
         # Get dropped domains - show all if no date filter
-        query_dropped = db.query(DroppedDomain).join(Tld)
+        dropped_filters = []
         
         # Apply date filter only if date is specified
         if selected_date:
-            query_dropped = query_dropped.filter(DroppedDomain.drop_date == selected_date)
+            dropped_filters.append(DroppedDomain.drop_date == selected_date)
         
         # Apply TLD filter
-        if tld:
-            query_dropped = query_dropped.filter(Tld.name == tld.lower())
+        if tld_clause is not None:
+            dropped_filters.append(tld_clause)
         
-        # Get total count before pagination
-        total_dropped = query_dropped.count()
-        total_pages = max(1, (total_dropped + page_size - 1) // page_size)
+        def count_dropped() -> int:
+            return db.execute(
+                select(func.count(DroppedDomain.id)).select_from(DroppedDomain).join(
+                    DroppedDomain.tld
+                ).where(*dropped_filters)
+            ).scalar()
         
-        # Ensure page is within bounds
-        if page > total_pages:
-            page = total_pages
+        def load_page(page: int) -> list:
+            # Order by drop_date (newest first), then by quality_score (highest first), then by domain name
+            # Unscored domains go last without a CASE that would keep the
+            # index from supplying the order
+            return db.execute(
+                select_drop_rows().where(*dropped_filters).order_by(
+                    desc(DroppedDomain.drop_date),
+                    quality_score_desc(db),
+                    DroppedDomain.domain
+                ).offset((page - 1) * page_size).limit(page_size + 1)
+            ).all()
         
-        # Calculate offset
-        offset = (page - 1) * page_size
+        # The full COUNT is only run on request; by default we peek one row
+        # past the page to learn whether a next page exists.
+        total_known = exact_count
+        if exact_count:
+            total_dropped = count_dropped()
+            total_pages = max(1, (total_dropped + page_size - 1) // page_size)
+            
+            # Ensure page is within bounds
+            if page > total_pages:
+                page = total_pages
         
-        # Order and paginate
-        # Order by drop_date (newest first), then by quality_score (highest first), then by domain name
-        # MySQL doesn't support NULLS LAST, so we use CASE to put NULLs at the end
-        dropped_domains_list = query_dropped.order_by(
-            desc(DroppedDomain.drop_date),
-            case((DroppedDomain.quality_score.is_(None), 1), else_=0),  # NULL values last
-            desc(DroppedDomain.quality_score),
-            DroppedDomain.domain
-        ).offset(offset).limit(page_size).all()
+        page_rows = load_page(page)
         
-        dropped_domains = [
-            DropRead(
-                id=drop.id,
-                domain=drop.domain,
-                tld=drop.tld.name,
-                drop_date=drop.drop_date,
-                length=drop.length,
-                charset_type=drop.charset_type
-            )
-            for drop in dropped_domains_list
-        ]
+        # A page past the end came back empty: one COUNT finds the last real
+        # page, which is shown instead of an empty page with a made-up total
+        if not page_rows and page > 1 and not total_known:
+            total_known = True
+            total_dropped = count_dropped()
+            total_pages = max(1, (total_dropped + page_size - 1) // page_size)
+            page = total_pages
+            page_rows = load_page(page)
         
-        # Get future dropping domains (only when date is selected)
-        if selected_date:
-            future_date = selected_date + timedelta(days=future_days)
-            query_future = db.query(DroppedDomain).join(Tld)
-            query_future = query_future.filter(
-                and_(
-                    DroppedDomain.drop_date > selected_date,
-                    DroppedDomain.drop_date <= future_date
-                )
-            )
-            
-            if tld:
-                query_future = query_future.filter(Tld.name == tld.lower())
-            
-            future_domains_list = query_future.order_by(
-                DroppedDomain.drop_date,
-                case((DroppedDomain.quality_score.is_(None), 1), else_=0),  # NULL values last
-                desc(DroppedDomain.quality_score),
-                DroppedDomain.domain
-            ).limit(100).all()
-            
-            future_domains = [
-                DropRead(
-                    id=drop.id,
-                    domain=drop.domain,
-                    tld=drop.tld.name,
-                    drop_date=drop.drop_date,
-                    length=drop.length,
-                    charset_type=drop.charset_type
-                )
-                for drop in future_domains_list
-            ]
-            
-            total_future = query_future.count()
-        else:
-            future_domains = []
-            total_future = 0
+        has_next = len(page_rows) > page_size
+        # The template only reads attributes once, so the projected rows are
+        # rendered as-is rather than copied into a second list of DropRead models
+        dropped_domains = page_rows[:page_size]
+        
+        if not total_known:
+            total_dropped = (page - 1) * page_size + len(dropped_domains)
+            total_pages = page + 1 if has_next else page
         
-        # Calculate page range for pagination
-        if total_pages <= 7:
-            page_range = list(range(1, total_pages + 1))
-        else:
-            if page <= 4:
-                page_range = list(range(1, 6)) + ['...', total_pages]
-            elif page >= total_pages - 3:
-                page_range = [1, '...'] + list(range(total_pages - 4, total_pages + 1))
-            else:
-                page_range = [1, '...'] + list(range(page - 1, page + 2)) + ['...', total_pages]
+        # Collect the future drops queried alongside the page
+        if future_job is not None:
+            future_domains, total_future = future_job.result()
+        elif selected_date:
+            future_domains, total_future = _load_future_drops(db, selected_date, future_days, tld_clause)
         
-    except Exception as e:
-        import logging
-        logging.error(f"Database error in domains_list route: {e}")
-        # On error, ensure page_range is set
-        if not page_range:
-            page_range = [1]
+    except Exception:
+        logger.exception("Database error in domains_list route")
     
-    return templates.TemplateResponse("domains_list.html", {
+    # Up to 500 rows plus future drops; stream the rows as they render
+    return stream_template("domains_list.html", {
         "request": request,
         "active_tlds": active_tlds,
         "selected_date": selected_date,
@@ -168,7 +229,9 @@ def domains_list(
         "page": page,
         "page_size": page_size,
         "total_pages": total_pages,
-        "page_range": page_range,
+        "has_next": has_next,
+        "exact_count": exact_count,
+        "page_range": compute_page_range(page, total_pages),
         "valid_page_sizes": valid_page_sizes
     })
 
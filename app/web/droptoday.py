@@ -1,21 +1,25 @@
 """
 Web route for today's dropping domains with filters.
 """
+import logging
 from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_, case
+from sqlalchemy import func, and_
 
 from app.core.database import get_db
-from app.models.tld import Tld
+from app.core.drop_cache import count_drops_on, get_latest_drop_date
+from app.core.drop_rows import quality_score_desc, query_drop_rows, to_drop_reads
+from app.core.tld_cache import drop_tld_filter, get_active_tlds
 from app.models.drop import DroppedDomain
-from app.schemas.drop import DropRead
+from app.web.pagination import compute_page_range
+from app.web.templating import templates
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/droptoday", response_class=HTMLResponse)
@@ -46,40 +50,39 @@ def drop_today(
     dropped_domains = []
     total_dropped = 0
     total_pages = 1
-    page_range = []
     show_date = today  # Date to show (today or latest available)
     is_today = True  # Whether we're showing today's date or fallback
     
     try:
         # Get all active TLDs for filter
-        active_tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
+        active_tlds = get_active_tlds(db)
         
-        # Check if there are domains for today
-        today_count = db.query(DroppedDomain).filter(DroppedDomain.drop_date == today).count()
+        # Check if there are domains for today; both this and the latest date
+        # come from cached aggregates, so neither costs a round-trip per request
+        has_today = count_drops_on(db, today) > 0
         
         # If no domains for today, use the latest available date
-        if today_count == 0:
-            latest_date = db.query(func.max(DroppedDomain.drop_date)).scalar()
+        if not has_today:
+            latest_date = get_latest_drop_date(db)
             if latest_date:
                 show_date = latest_date
                 is_today = False
         
         # Build query for the selected date
-        query = db.query(DroppedDomain).join(Tld).filter(
+        query = query_drop_rows(db).filter(
             DroppedDomain.drop_date == show_date
         )
         
         # Apply TLD filter
         if tld:
-            query = query.filter(Tld.name == tld.lower())
+            query = query.filter(drop_tld_filter(db, tld))
         
         # Apply search filter
         if search:
-            search_term = f"%{search.lower()}%"
+            # Domains are stored lowercase, so a plain LIKE matches without
+            # lower() on every row; % and _ in the input are matched literally
             query = query.filter(
-                or_(
-                    DroppedDomain.domain.ilike(search_term)
-                )
+                DroppedDomain.domain.contains(search.lower(), autoescape=True)
             )
         
         # Apply length filters
@@ -92,54 +95,35 @@ def drop_today(
         if charset_type:
             query = query.filter(DroppedDomain.charset_type == charset_type.lower())
         
-        # Get total count before pagination
-        total_dropped = query.count()
+        # Order by quality_score (highest first), then by domain name
+        # Served in index order by idx_drop_date_score, or idx_drop_listing with a TLD
+        ordered = query.order_by(
+            quality_score_desc(db),  # Unscored domains last
+            DroppedDomain.domain
+        )
+        
+        # Fetch the page plus one row; a short page means we already know the total
+        offset = (page - 1) * page_size
+        page_rows = ordered.offset(offset).limit(page_size + 1).all()
+        
+        if len(page_rows) <= page_size and (page_rows or page == 1):
+            total_dropped = offset + len(page_rows)
+        else:
+            total_dropped = query.with_entities(func.count(DroppedDomain.id)).scalar()
         total_pages = max(1, (total_dropped + page_size - 1) // page_size)
         
         # Ensure page is within bounds
         if page > total_pages:
             page = total_pages
+            offset = (page - 1) * page_size
+            page_rows = ordered.offset(offset).limit(page_size).all()
         
-        # Calculate offset
-        offset = (page - 1) * page_size
-        
-        # Order and paginate
-        # Order by quality_score (highest first), then by domain name
-        dropped_domains_list = query.order_by(
-            case((DroppedDomain.quality_score.is_(None), 1), else_=0),  # NULL values last
-            desc(DroppedDomain.quality_score),
-            DroppedDomain.domain
-        ).offset(offset).limit(page_size).all()
+        dropped_domains_list = page_rows[:page_size]
         
-        dropped_domains = [
-            DropRead(
-                id=drop.id,
-                domain=drop.domain,
-                tld=drop.tld.name,
-                drop_date=drop.drop_date,
-                length=drop.length,
-                charset_type=drop.charset_type
-            )
-            for drop in dropped_domains_list
-        ]
-        
-        # Calculate page range for pagination
-        if total_pages <= 7:
-            page_range = list(range(1, total_pages + 1))
-        else:
-            if page <= 4:
-                page_range = list(range(1, 6)) + ['...', total_pages]
-            elif page >= total_pages - 3:
-                page_range = [1, '...'] + list(range(total_pages - 4, total_pages + 1))
-            else:
-                page_range = [1, '...'] + list(range(page - 1, page + 2)) + ['...', total_pages]
+        dropped_domains = to_drop_reads(dropped_domains_list)
         
-    except Exception as e:
-        import logging
-        logging.error(f"Database error in drop_today route: {e}", exc_info=True)
-        # On error, ensure page_range is set
-        if not page_range:
-            page_range = [1]
+    except Exception:
+        logger.exception("Database error in drop_today route")
         # Ensure show_date and is_today are set even on error
         if 'show_date' not in locals():
             show_date = today
@@ -161,7 +145,7 @@ def drop_today(
         "page": page,
         "page_size": page_size,
         "total_pages": total_pages,
-        "page_range": page_range,
+        "page_range": compute_page_range(page, total_pages),
         "valid_page_sizes": valid_page_sizes
     })
 
@@ -2,9 +2,8 @@
 Web routes for favorites management.
 """
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
 
 from app.core.database import get_db
@@ -12,9 +11,9 @@ from app.models.user import User, UserFavorite
 from app.models.drop import DroppedDomain
 from app.services.subscription_service import SubscriptionService, get_subscription_service
 from app.web.auth_web import get_current_user_from_cookie
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/favorites", response_class=HTMLResponse)
@@ -40,12 +39,15 @@ def favorites_page(
     query = db.query(UserFavorite).filter(UserFavorite.user_id == user.id)
     total = query.count()
     
-    favorites = query.order_by(UserFavorite.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
+    # Load each favorite's domain and TLD in the same query
+    favorites = query.options(
+        joinedload(UserFavorite.domain).joinedload(DroppedDomain.tld)
+    ).order_by(UserFavorite.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
     
     # Enrich with domain info
     favorite_list = []
     for fav in favorites:
-        domain = db.query(DroppedDomain).filter(DroppedDomain.id == fav.domain_id).first()
+        domain = fav.domain
         favorite_list.append({
             "id": fav.id,
             "domain_id": fav.domain_id,
@@ -87,21 +89,23 @@ def add_favorite(
     
     # Check plan limit
     service = get_subscription_service(db)
-    is_within_limit, current_usage, max_allowed = service.check_plan_limit(user, "favorites_max")
-    
-    if not is_within_limit:
+    if not service.is_within_plan_limit(user, "favorites_max"):
+        # Only a rejected add needs the exact usage for the message
+        _, current_usage, max_allowed = service.check_plan_limit(user, "favorites_max")
         # Redirect with error message
         return RedirectResponse(url=f"/favorites?error=limit_reached&current={current_usage}&max={max_allowed}", status_code=302)
     
     # Check if already favorited
-    existing = db.query(UserFavorite).filter(
-        and_(
-            UserFavorite.user_id == user.id,
-            UserFavorite.domain_id == domain_id
-        )
-    ).first()
+    already_favorited = db.query(
+        db.query(UserFavorite.id).filter(
+            and_(
+                UserFavorite.user_id == user.id,
+                UserFavorite.domain_id == domain_id
+            )
+        ).exists()
+    ).scalar()
     
-    if existing:
+    if already_favorited:
         return RedirectResponse(url="/favorites?error=already_favorited", status_code=302)
     
     # Create favorite
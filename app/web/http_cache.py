@@ -0,0 +1,86 @@
+"""
+HTTP caching headers for public, read-mostly pages.
+"""
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.core.config import get_settings
+
+# Pages whose data changes at most when an import runs
+PAGE_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=60"
+# Pages with no data at all
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=3600"
+
+# Templates are edited live during local development, so don't let browsers
+# hold on to pages there
+HTTP_CACHE_ENABLED = get_settings().ENV != "local"
+
+
+def _templates_version() -> str:
+    """
+    Newest template mtime, so a deploy with changed templates changes every ETag.
+    
+    Derived from the files rather than the process so all workers agree.
+    """
+    mtimes = [path.stat().st_mtime_ns for path in Path("templates").rglob("*.html")]
+    return str(max(mtimes, default=0))
+
+
+_TEMPLATES_VERSION = _templates_version()
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from the values a page is rendered from.
+    
+    Args:
+        *parts: Values that change whenever the page content changes
+    
+    Returns:
+        Quoted ETag string
+    """
+    key = ":".join([_TEMPLATES_VERSION, *(str(part) for part in parts)])
+    return '"' + hashlib.md5(key.encode()).hexdigest() + '"'
+
+
+def not_modified_response(request: Request, etag: str, cache_control: str = PAGE_CACHE_CONTROL) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has this ETag, otherwise None.
+    
+    Args:
+        request: Incoming request
+        etag: ETag of the page that would be rendered
+        cache_control: Cache-Control value to repeat on the 304
+    
+    Returns:
+        304 Response or None
+    """
+    if not HTTP_CACHE_ENABLED:
+        return None
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
+
+
+def set_cache_headers(response: Response, cache_control: str = PAGE_CACHE_CONTROL, etag: Optional[str] = None) -> Response:
+    """
+    Add Cache-Control (and optionally ETag) headers to a response.
+    
+    Args:
+        response: Response to modify
+        cache_control: Cache-Control header value
+        etag: Optional ETag header value
+    
+    Returns:
+        The same response, for chaining
+    """
+    if HTTP_CACHE_ENABLED:
+        response.headers["Cache-Control"] = cache_control
+        if etag:
+            response.headers["ETag"] = etag
+    return response
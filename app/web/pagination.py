@@ -0,0 +1,26 @@
+"""
+Pagination helpers shared by listing pages.
+"""
+from functools import lru_cache
+from typing import Tuple, Union
+
+
+@lru_cache(maxsize=1024)
+def compute_page_range(page: int, total_pages: int) -> Tuple[Union[int, str], ...]:
+    """
+    Page links to show around the current page, with '...' for gaps.
+    
+    Args:
+        page: Current page number
+        total_pages: Total number of pages
+    
+    Returns:
+        Tuple of page numbers and '...' markers
+    """
+    if total_pages <= 7:
+        return tuple(range(1, total_pages + 1))
+    if page <= 4:
+        return (*range(1, 6), '...', total_pages)
+    if page >= total_pages - 3:
+        return (1, '...', *range(total_pages - 4, total_pages + 1))
+    return (1, '...', *range(page - 1, page + 2), '...', total_pages)
@@ -1,21 +1,28 @@
 """
 Web routes for HTML pages.
 """
+import logging
 from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 
 from app.core.database import get_db
+from app.core.drop_cache import count_drops_on, get_latest_drop_date
+from app.core.drop_rows import query_drop_rows, to_drop_reads
+from app.core.tld_cache import drop_tld_filter, find_active_tld, get_active_tlds
 from app.models.tld import Tld
 from app.models.drop import DroppedDomain
-from app.schemas.drop import DropRead
+from app.web.http_cache import (
+    STATIC_PAGE_CACHE_CONTROL, make_etag, not_modified_response, set_cache_headers
+)
+from app.web.templating import templates
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -28,48 +35,45 @@ def home(request: Request, db: Session = Depends(get_db)):
     latest_date = None
     latest_drop_count = 0
     preview_results = []
+    etag = None
     
     try:
         # Get stats
-        tld_count = db.query(Tld).filter(Tld.is_active == True).count()
+        tld_count = len(get_active_tlds(db))
         
-        latest_date = db.query(func.max(DroppedDomain.drop_date)).scalar()
+        latest_date = get_latest_drop_date(db)
         
         if latest_date:
-            latest_drop_count = db.query(func.count(DroppedDomain.id)).filter(
-                DroppedDomain.drop_date == latest_date
-            ).scalar()
+            latest_drop_count = count_drops_on(db, latest_date)
+        
+        # The page only changes when these do; let the client reuse its copy
+        etag = make_etag(latest_date, tld_count, latest_drop_count)
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
         
         # Get top 20 latest drops for preview
-        preview_drops = db.query(DroppedDomain).join(Tld).order_by(
+        preview_drops = query_drop_rows(db).order_by(
             desc(DroppedDomain.drop_date),
             DroppedDomain.domain
         ).limit(20).all()
         
-        preview_results = [
-            DropRead(
-                id=drop.id,
-                domain=drop.domain,
-                tld=drop.tld.name,
-                drop_date=drop.drop_date,
-                length=drop.length,
-                charset_type=drop.charset_type
-            )
-            for drop in preview_drops
-        ]
-    except Exception as e:
+        preview_results = to_drop_reads(preview_drops)
+    except Exception:
         # If database is not available, use default values
-        import logging
-        logging.error(f"Database error in home route: {e}")
+        logger.exception("Database error in home route")
         # Values already set to defaults above
     
-    return templates.TemplateResponse("home.html", {
+    response = templates.TemplateResponse("home.html", {
         "request": request,
         "tld_count": tld_count,
         "latest_date": latest_date,
         "latest_drop_count": latest_drop_count,
         "preview_drops": preview_results
     })
+    if etag:
+        set_cache_headers(response, etag=etag)
+    return response
 
 
 @router.get("/drops", response_class=HTMLResponse)
@@ -84,14 +88,13 @@ def drops_list(
     """
     try:
         # Get all active TLDs for filter
-        active_tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
+        active_tlds = get_active_tlds(db)
         
         # Determine date to show
         if date_filter is None:
-            date_filter = db.query(func.max(DroppedDomain.drop_date)).scalar()
-    except Exception as e:
-        import logging
-        logging.error(f"Database error in drops_list route: {e}")
+            date_filter = get_latest_drop_date(db)
+    except Exception:
+        logger.exception("Database error in drops_list route")
         active_tlds = []
         date_filter = None
     
@@ -100,32 +103,36 @@ def drops_list(
     total_count = 0
     
     try:
-        query = db.query(DroppedDomain).join(Tld)
+        query = query_drop_rows(db)
         
         if date_filter:
             query = query.filter(DroppedDomain.drop_date == date_filter)
         
         if tld:
-            query = query.filter(Tld.name == tld.lower())
+            query = query.filter(drop_tld_filter(db, tld))
         
-        initial_drops = query.order_by(DroppedDomain.domain).limit(50).all()
+        # Peek one row past the page; only count when the page is full
+        initial_drops = query.order_by(DroppedDomain.domain).limit(51).all()
+        has_more = len(initial_drops) > 50
+        initial_drops = initial_drops[:50]
         
-        initial_results = [
-            DropRead(
-                id=drop.id,
-                domain=drop.domain,
-                tld=drop.tld.name,
-                drop_date=drop.drop_date,
-                length=drop.length,
-                charset_type=drop.charset_type
-            )
-            for drop in initial_drops
-        ]
+        initial_results = to_drop_reads(initial_drops)
         
-        total_count = query.count() if date_filter else 0
-    except Exception as e:
-        import logging
-        logging.error(f"Database error in drops_list query: {e}")
+        if not date_filter:
+            total_count = 0
+        elif not has_more:
+            total_count = len(initial_drops)
+        else:
+            # A full page: count_drops_on counts just that date (and TLD) on
+            # the index prefix and caches it per date and TLD; an unknown TLD
+            # falls back to counting the filtered query directly
+            tld_ref = find_active_tld(db, tld) if tld else None
+            if tld and tld_ref is None:
+                total_count = query.with_entities(func.count(DroppedDomain.id)).scalar()
+            else:
+                total_count = count_drops_on(db, date_filter, tld_ref.id if tld_ref else None)
+    except Exception:
+        logger.exception("Database error in drops_list query")
         # Values already set to defaults above
     
     return templates.TemplateResponse("drops_list.html", {
@@ -146,15 +153,17 @@ def tld_list(request: Request, db: Session = Depends(get_db)):
     tlds = []
     try:
         tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
-    except Exception as e:
-        import logging
-        logging.error(f"Database error in tld_list route: {e}")
+    except Exception:
+        logger.exception("Database error in tld_list route")
         # tlds already set to empty list above
     
-    return templates.TemplateResponse("tld_list.html", {
+    response = templates.TemplateResponse("tld_list.html", {
         "request": request,
         "tlds": tlds
     })
+    if tlds:
+        set_cache_headers(response)
+    return response
 
 
 @router.get("/about", response_class=HTMLResponse)
@@ -162,7 +171,7 @@ def about(request: Request):
     """
     About page.
     """
-    return templates.TemplateResponse("about.html", {
+    return set_cache_headers(templates.TemplateResponse("about.html", {
         "request": request
-    })
+    }), STATIC_PAGE_CACHE_CONTROL)
 
@@ -3,10 +3,11 @@ Web routes for statistics dashboard.
 """
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+
+from app.web.http_cache import STATIC_PAGE_CACHE_CONTROL, set_cache_headers
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/stats", response_class=HTMLResponse)
@@ -14,10 +15,10 @@ def stats_dashboard(request: Request):
     """
     Render the statistics dashboard page.
     """
-    return templates.TemplateResponse(
+    return set_cache_headers(templates.TemplateResponse(
         "stats/dashboard.html",
         {"request": request}
-    )
+    ), STATIC_PAGE_CACHE_CONTROL)
 
 
 @router.get("/analytics", response_class=HTMLResponse)
@@ -25,10 +26,10 @@ def analytics_redirect(request: Request):
     """
     Redirect alias for stats dashboard.
     """
-    return templates.TemplateResponse(
+    return set_cache_headers(templates.TemplateResponse(
         "stats/dashboard.html",
         {"request": request}
-    )
+    ), STATIC_PAGE_CACHE_CONTROL)
 
 
 
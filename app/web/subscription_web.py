@@ -2,7 +2,6 @@
 Web routes for subscription management.
 """
 from fastapi import APIRouter, Depends, Request, Form, Query
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -12,9 +11,9 @@ from app.models.subscription import SubscriptionPlan
 from app.services.subscription_service import SubscriptionService, get_subscription_service
 from app.services.stripe_service import StripeService, get_stripe_service
 from app.web.auth_web import get_current_user_from_cookie
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/pricing", response_class=HTMLResponse)
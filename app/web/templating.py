@@ -0,0 +1,67 @@
+"""
+Shared Jinja2 templates instance for all web routes.
+"""
+import logging
+from fastapi.responses import StreamingResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# One environment for every router, so each template is compiled once per
+# process and reused across modules.
+templates = Jinja2Templates(directory="templates")
+
+# Template output pieces joined into each streamed chunk
+STREAM_BUFFER_SIZE = 200
+
+# Templates only change on disk during local development; elsewhere skip the
+# per-render mtime check.
+templates.env.auto_reload = get_settings().ENV == "local"
+
+# Persist compiled template bytecode on disk so new workers and restarted
+# processes skip the parse/compile step. Entries are keyed on the template
+# source checksum, so an edited template is recompiled automatically. With no
+# directory given, Jinja uses a private per-user folder under the system temp dir.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+
+def warm_templates() -> int:
+    """
+    Load every HTML template into the environment's cache.
+    
+    With the bytecode cache this is mostly a disk read per template, and the
+    first visitor to each page no longer pays for the parse/compile.
+    
+    Returns:
+        Number of templates loaded
+    """
+    loaded = 0
+    for name in templates.env.list_templates(extensions=["html"]):
+        try:
+            templates.env.get_template(name)
+            loaded += 1
+        except Exception as e:
+            logger.warning(f"Could not precompile template {name}: {e}")
+    return loaded
+
+
+def stream_template(name: str, context: dict) -> StreamingResponse:
+    """
+    Render a template as a streamed HTML response.
+    
+    Chunks are sent as the template loops instead of the whole page being
+    built in memory first, so large listings start reaching the client sooner.
+    
+    Args:
+        name: Template name
+        context: Template context, including "request"
+        
+    Returns:
+        StreamingResponse with the rendered HTML
+    """
+    stream = templates.get_template(name).stream(context)
+    stream.enable_buffering(STREAM_BUFFER_SIZE)
+    return StreamingResponse(stream, media_type="text/html")
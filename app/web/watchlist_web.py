@@ -1,19 +1,65 @@
 """
 Web routes for watchlist management.
 """
+import re
+
 from fastapi import APIRouter, Depends, Request, Form, Query, HTTPException
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from app.core.database import get_db
+from app.core.drop_rows import quality_score_desc, query_drop_rows
+from app.core.tld_cache import get_active_tlds
+from app.models.drop import DroppedDomain
+from app.models.tld import Tld
 from app.models.user import User, UserWatchlist
 from app.services.subscription_service import SubscriptionService, get_subscription_service
+from app.services.watchlist_matcher import compile_domain_pattern
 from app.web.auth_web import get_current_user_from_cookie
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Watchlist patterns that are plain labels with * wildcards map onto LIKE
+_LIKE_PATTERN_RE = re.compile(r"[a-z0-9*-]+")
+
+
+def _domain_pattern_filter(db: Session, domain_pattern: str):
+    """
+    Translate a watchlist domain pattern into a SQL filter on the SLD.
+    
+    Patterns are case-insensitive regexes searched in the first label, with
+    * as a wildcard. Plain label/wildcard patterns become a LIKE; anything else
+    uses the database's regex operator.
+    
+    Args:
+        db: Database session, used to pick the dialect's regex operator
+        domain_pattern: Pattern from the watchlist
+        
+    Returns:
+        Filter clause, or None if the pattern can't be applied (invalid regex,
+        or no regex support in the database)
+    """
+    pattern = domain_pattern.lower()
+    if _LIKE_PATTERN_RE.fullmatch(pattern):
+        # Requiring a "." after the match keeps it out of the TLD label
+        return DroppedDomain.domain.like("%" + pattern.replace("*", "%") + "%.%")
+    
+    pattern = pattern.replace("*", ".*")
+    try:
+        re.compile(pattern)
+    except re.error:
+        return None  # Invalid regex, skip pattern check
+    
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        sld = func.substring_index(DroppedDomain.domain, ".", 1)
+        return sld.op("REGEXP")(pattern)
+    if dialect == "postgresql":
+        sld = func.split_part(DroppedDomain.domain, ".", 1)
+        return sld.op("~*")(pattern)
+    return None
 
 
 @router.get("/watchlists", response_class=HTMLResponse)
@@ -39,8 +85,7 @@ def watchlists_page(
     ).order_by(UserWatchlist.created_at.desc()).all()
     
     # Get TLD list for filter dropdown
-    from app.models.tld import Tld
-    tlds = db.query(Tld).filter(Tld.is_active == True).order_by(Tld.name).all()
+    tlds = get_active_tlds(db)
     
     return templates.TemplateResponse("auth/watchlists.html", {
         "request": request,
@@ -76,9 +121,9 @@ def create_watchlist(
     
     # Check plan limit
     service = get_subscription_service(db)
-    is_within_limit, current_usage, max_allowed = service.check_plan_limit(user, "watchlist_max")
-    
-    if not is_within_limit:
+    if not service.is_within_plan_limit(user, "watchlist_max"):
+        # Only a rejected add needs the exact usage for the message
+        _, current_usage, max_allowed = service.check_plan_limit(user, "watchlist_max")
         return RedirectResponse(url=f"/watchlists?error=limit_reached&current={current_usage}&max={max_allowed}", status_code=302)
     
     # Create watchlist
@@ -153,12 +198,8 @@ def watchlist_matches(
         raise HTTPException(status_code=404, detail="Watchlist not found")
     
     # Get matched domains using watchlist criteria
-    from app.models.drop import DroppedDomain
-    from app.models.tld import Tld
-    import re
-    
-    # Start with all dropped domains
-    query = db.query(DroppedDomain).join(Tld)
+    # Start with all dropped domains, projected to the columns the page shows
+    query = query_drop_rows(db).add_columns(DroppedDomain.quality_score)
     
     # Apply TLD filter
     if watchlist.tld_filter:
@@ -175,58 +216,57 @@ def watchlist_matches(
     if watchlist.min_quality_score:
         query = query.filter(DroppedDomain.quality_score >= watchlist.min_quality_score)
     
-    # Get all matching domains
-    all_domains = query.order_by(DroppedDomain.drop_date.desc(), DroppedDomain.quality_score.desc()).all()
+    # Apply domain pattern filter; a valid regex the database can't evaluate
+    # is checked row by row below instead
+    pattern_re = None
+    if watchlist.domain_pattern:
+        pattern_clause = _domain_pattern_filter(db, watchlist.domain_pattern)
+        if pattern_clause is not None:
+            query = query.filter(pattern_clause)
+        else:
+            pattern_re = compile_domain_pattern(watchlist.domain_pattern)
     
-    # Filter by domain pattern and charset (requires domain name extraction)
-    matched_domains = []
-    for domain in all_domains:
-        domain_name = domain.domain.split('.')[0] if '.' in domain.domain else domain.domain
-        
-        # Check domain pattern
-        if watchlist.domain_pattern:
-            try:
-                pattern = watchlist.domain_pattern.replace('*', '.*')
-                if not re.search(pattern, domain_name, re.IGNORECASE):
-                    continue
-            except re.error:
-                pass  # Invalid regex, skip pattern check
-        
-        # Check charset filter
-        if watchlist.charset_filter:
-            if watchlist.charset_filter == "letters" and not domain_name.isalpha():
-                continue
-            elif watchlist.charset_filter == "numbers" and not domain_name.isdigit():
-                continue
-            elif watchlist.charset_filter == "mixed":
-                if not (domain_name.isalnum() and not domain_name.isalpha() and not domain_name.isdigit()):
-                    continue
+    # Apply charset filter; charset_type is stored from the same isalpha/isdigit
+    # checks on the SLD, except that "mixed" there also covers hyphenated names
+    if watchlist.charset_filter in ("letters", "numbers"):
+        query = query.filter(DroppedDomain.charset_type == watchlist.charset_filter)
+    elif watchlist.charset_filter == "mixed":
+        query = query.filter(
+            DroppedDomain.charset_type == "mixed",
+            ~DroppedDomain.domain.like("%-%")
+        )
+    
+    offset = (page - 1) * page_size
+    ordered = query.order_by(
+        DroppedDomain.drop_date.desc(), quality_score_desc(db)
+    )
+    
+    if pattern_re is not None:
+        # Stream the candidates in batches, keeping only the requested page
+        # and counting the other matches without holding them
+        paginated_domains = []
+        total = 0
+        for row in ordered.yield_per(1000):
+            if pattern_re.search(row.domain.split(".")[0]):
+                if offset <= total < offset + page_size:
+                    paginated_domains.append(row)
+                total += 1
+    else:
+        # Paginate in the database; a short page already gives the total, so
+        # only count when there may be rows beyond it
+        paginated_domains = ordered.offset(offset).limit(page_size).all()
         
-        matched_domains.append(domain)
-    
-    # Pagination
-    total = len(matched_domains)
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_domains = matched_domains[start:end]
-    
-    # Format matches for template
-    matches = []
-    for domain in paginated_domains:
-        matches.append({
-            "id": domain.id,
-            "domain": domain.domain,
-            "tld": domain.tld.name if domain.tld else "",
-            "drop_date": domain.drop_date,
-            "quality_score": domain.quality_score,
-            "length": domain.length,
-            "charset_type": domain.charset_type
-        })
+        if len(paginated_domains) < page_size and (paginated_domains or page == 1):
+            total = offset + len(paginated_domains)
+        else:
+            total = query.with_entities(func.count(DroppedDomain.id)).scalar()
     
+    # Rows carry id, domain, tld (name), drop_date, length, charset_type and
+    # quality_score as attributes, so the template reads them directly
     return templates.TemplateResponse("auth/watchlist_matches.html", {
         "request": request,
         "watchlist": watchlist,
-        "matches": matches,
+        "matches": paginated_domains,
         "page": page,
         "page_size": page_size,
         "total": total,
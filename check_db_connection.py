@@ -30,11 +30,23 @@ if db_url != 'NOT SET':
         print("Attempting to connect...")
         
         from app.core.database import engine
-        from sqlalchemy import text
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            print("✓ Connection successful!")
-            print(f"  Result: {result.fetchone()}")
+        # Talk to the driver connection directly: PyMySQL's ping() is a single
+        # COM_PING round trip, with no pre-ping or SELECT through the engine
+        raw_conn = engine.raw_connection()
+        try:
+            driver_conn = raw_conn.driver_connection
+            if hasattr(driver_conn, "ping"):
+                driver_conn.ping(reconnect=False)
+                print("✓ Connection successful!")
+                print("  Result: ping OK")
+            else:
+                cursor = raw_conn.cursor()
+                cursor.execute("SELECT 1")
+                print("✓ Connection successful!")
+                print(f"  Result: {cursor.fetchone()}")
+                cursor.close()
+        finally:
+            raw_conn.close()
             
     except Exception as e:
         print(f"\n✗ Connection failed!")
@@ -19,14 +19,13 @@ try:
     total_drops = db.query(func.count(DroppedDomain.id)).scalar()
     print(f"  ✅ Toplam Dropped Domain: {total_drops}")
     
-    # TLD bazında
-    tlds = db.query(Tld).all()
-    print(f"\n  📋 TLD'ler ({len(tlds)} adet):")
-    for tld in tlds:
-        tld_drops = db.query(func.count(DroppedDomain.id)).filter(
-            DroppedDomain.tld_id == tld.id
-        ).scalar()
-        print(f"    - .{tld.name}: {tld_drops} domain")
+    # TLD bazında (tek GROUP BY sorgusu; domain'i olmayan TLD'ler 0 ile gelir)
+    tld_counts = db.query(Tld.name, func.count(DroppedDomain.id)).outerjoin(
+        DroppedDomain, DroppedDomain.tld_id == Tld.id
+    ).group_by(Tld.id, Tld.name).all()
+    print(f"\n  📋 TLD'ler ({len(tld_counts)} adet):")
+    for tld_name, tld_drops in tld_counts:
+        print(f"    - .{tld_name}: {tld_drops} domain")
     
     # Son 5 domain
     recent = db.query(DroppedDomain).order_by(desc(DroppedDomain.created_at)).limit(5).all()
@@ -2,10 +2,15 @@
 from sqlalchemy import text
 from app.core.database import engine
 
-with engine.connect() as conn:
-    conn.execute(text("UPDATE alembic_version SET version_num = 'ae3452e56c99'"))
-    conn.commit()
-    print("Alembic version updated")
+TARGET_REVISION = "ae3452e56c99"
+
+# begin() commits on exit, so this is a single UPDATE in one transaction
+with engine.begin() as conn:
+    conn.execute(
+        text("UPDATE alembic_version SET version_num = :revision"),
+        {"revision": TARGET_REVISION}
+    )
+print("Alembic version updated")
 
 
 
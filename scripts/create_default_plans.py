@@ -137,12 +137,12 @@ def create_default_plans():
             }
         ]
         
-        for plan_data in plans:
-            plan = SubscriptionPlan(**plan_data)
-            db.add(plan)
-            print(f"✅ Created plan: {plan.display_name} (${plan.price_monthly}/mo)")
-        
+        # One multi-row INSERT for all plans; every dict has the same keys
+        db.execute(SubscriptionPlan.__table__.insert(), plans)
         db.commit()
+        
+        for plan_data in plans:
+            print(f"✅ Created plan: {plan_data['display_name']} (${plan_data['price_monthly']}/mo)")
         print("\n🎉 All default plans created successfully!")
         
     except Exception as e:
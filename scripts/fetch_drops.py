@@ -6,8 +6,10 @@ Usage:
     python -m scripts.fetch_drops
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date, timedelta
+from typing import List, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,38 +18,108 @@ from app.core.config import get_settings
 from app.core.database import SessionLocal
 from app.models.tld import Tld
 from app.services.czds_client import CZDSClient
-from app.services.drop_detector import (
-    load_sld_set_for_day,
-    compute_dropped_slds,
-    persist_drops
-)
+from app.services.drop_detector import stream_dropped_slds, persist_drops
 
+# TLDs processed at the same time
+MAX_TLD_WORKERS = 4
 
-def ensure_tld_exists(db, tld_name: str) -> Tld:
+
+def ensure_tlds_exist(db, tld_names: List[str]) -> None:
     """
-    Ensure TLD exists in database, create if not.
+    Ensure all given TLDs exist in database, creating the missing ones.
+    
+    Existing names are read with one query and the missing TLDs are added
+    in a single commit, instead of one SELECT (and commit) per TLD.
     
     Args:
         db: Database session
+        tld_names: TLD names
+    """
+    wanted = list(dict.fromkeys(name.lower() for name in tld_names))
+    if not wanted:
+        return
+    
+    existing = {
+        name for (name,) in db.query(Tld.name).filter(Tld.name.in_(wanted)).all()
+    }
+    missing = [name for name in wanted if name not in existing]
+    
+    if missing:
+        db.add_all([
+            Tld(name=name, display_name=name, is_active=True)
+            for name in missing
+        ])
+        db.commit()
+        for name in missing:
+            print(f"Created TLD: {name}")
+
+
+def process_tld(client: CZDSClient, tld_name: str, yesterday: date, today: date) -> Tuple[str, int]:
+    """
+    Download both zones for one TLD, compute its drops and persist them.
+    
+    Runs in a worker thread, so it opens its own database session; the CZDS
+    client is shared so downloads reuse its pooled HTTPS connections.
+    
+    Args:
+        client: Shared CZDS client
         tld_name: TLD name
+        yesterday: Day the dropped domains were last seen
+        today: Day to compare against
         
     Returns:
-        Tld instance
+        Tuple of (TLD name, persisted drop count); the count is -1 when the
+        TLD was skipped or failed
     """
-    tld = db.query(Tld).filter(Tld.name == tld_name.lower()).first()
-    
-    if not tld:
-        tld = Tld(
-            name=tld_name.lower(),
-            display_name=tld_name.lower(),
-            is_active=True
-        )
-        db.add(tld)
-        db.commit()
-        db.refresh(tld)
-        print(f"Created TLD: {tld_name}")
+    # persist_drops commits before reloading the new rows by tld.id; keep
+    # the TLD loaded across that commit instead of re-selecting it
+    db = SessionLocal(expire_on_commit=False)
     
-    return tld
+    try:
+        tld = db.query(Tld).filter(Tld.name == tld_name).first()
+        
+        # Ensure zone files exist
+        try:
+            yesterday_zone = client.download_zone(tld.name, yesterday)
+            print(f"  [.{tld.name}] ✓ Yesterday zone: {yesterday_zone}")
+        except FileNotFoundError as e:
+            print(f"  [.{tld.name}] ✗ Yesterday zone not found: {e}")
+            return tld_name, -1
+        
+        try:
+            today_zone = client.download_zone(tld.name, today)
+            print(f"  [.{tld.name}] ✓ Today zone: {today_zone}")
+        except FileNotFoundError as e:
+            print(f"  [.{tld.name}] ✗ Today zone not found (may not be ready yet): {e}")
+            return tld_name, -1
+        
+        # Compute drops; yesterday's zone is streamed against today's
+        # SLD set rather than loaded as a second full set
+        dropped_slds, today_count = stream_dropped_slds(tld.name, yesterday, today)
+        
+        print(f"  [.{tld.name}] Today SLDs: {today_count}")
+        print(f"  [.{tld.name}] Dropped SLDs: {len(dropped_slds)}")
+        
+        if dropped_slds:
+            # Persist to database
+            persisted = persist_drops(db, tld, yesterday, dropped_slds)
+            print(f"  [.{tld.name}] ✓ Persisted {persisted} dropped domains")
+        else:
+            # Update TLD metadata even if no drops
+            tld.last_import_date = yesterday
+            tld.last_drop_count = 0
+            db.commit()
+            persisted = 0
+            print(f"  [.{tld.name}] ✓ No drops (updated metadata)")
+        
+        return tld_name, persisted
+        
+    except Exception as e:
+        print(f"  [.{tld_name}] ✗ Error processing {tld_name}: {e}")
+        db.rollback()
+        return tld_name, -1
+    finally:
+        db.close()
 
 
 def main():
@@ -57,13 +129,14 @@ def main():
     
     try:
         # Ensure all tracked TLDs exist
-        for tld_name in settings.tracked_tlds_list:
-            ensure_tld_exists(db, tld_name)
+        ensure_tlds_exist(db, settings.tracked_tlds_list)
         
         # Get active TLDs
-        active_tlds = db.query(Tld).filter(Tld.is_active == True).all()
+        active_tld_names = [
+            name for (name,) in db.query(Tld.name).filter(Tld.is_active == True).all()
+        ]
         
-        if not active_tlds:
+        if not active_tld_names:
             print("No active TLDs found. Exiting.")
             return
         
@@ -77,54 +150,19 @@ def main():
         # Initialize CZDS client
         client = CZDSClient()
         
-        # Process each TLD
-        for tld in active_tlds:
-            print(f"\nProcessing TLD: .{tld.name}")
-            
-            try:
-                # Ensure zone files exist
-                try:
-                    yesterday_zone = client.download_zone(tld.name, yesterday)
-                    print(f"  ✓ Yesterday zone: {yesterday_zone}")
-                except FileNotFoundError as e:
-                    print(f"  ✗ Yesterday zone not found: {e}")
-                    continue
-                
-                try:
-                    today_zone = client.download_zone(tld.name, today)
-                    print(f"  ✓ Today zone: {today_zone}")
-                except FileNotFoundError as e:
-                    print(f"  ✗ Today zone not found (may not be ready yet): {e}")
-                    continue
-                
-                # Load SLD sets
-                prev_set = load_sld_set_for_day(tld.name, yesterday)
-                current_set = load_sld_set_for_day(tld.name, today)
-                
-                print(f"  Yesterday SLDs: {len(prev_set)}")
-                print(f"  Today SLDs: {len(current_set)}")
-                
-                # Compute drops
-                dropped_slds = compute_dropped_slds(prev_set, current_set)
-                print(f"  Dropped SLDs: {len(dropped_slds)}")
-                
-                if dropped_slds:
-                    # Persist to database
-                    persisted = persist_drops(db, tld, yesterday, dropped_slds)
-                    print(f"  ✓ Persisted {persisted} dropped domains")
-                else:
-                    # Update TLD metadata even if no drops
-                    tld.last_import_date = yesterday
-                    tld.last_drop_count = 0
-                    db.commit()
-                    print(f"  ✓ No drops (updated metadata)")
-                
-            except Exception as e:
-                print(f"  ✗ Error processing {tld.name}: {e}")
-                db.rollback()
-                continue
+        # TLDs are independent, so one TLD's downloads overlap another's diff.
+        # Each worker holds a full zone's SLD hashes, which is what caps the pool size.
+        max_workers = min(MAX_TLD_WORKERS, len(active_tld_names))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-drops") as executor:
+            results = list(executor.map(
+                lambda tld_name: process_tld(client, tld_name, yesterday, today),
+                active_tld_names
+            ))
         
         print("\n" + "-" * 60)
+        for tld_name, persisted in results:
+            status = "skipped/failed" if persisted < 0 else f"{persisted} drops"
+            print(f"  .{tld_name}: {status}")
         print("Processing complete!")
         
     except Exception as e:
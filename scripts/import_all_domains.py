@@ -5,11 +5,16 @@ This is useful when you have zone files but want to import all current domains.
 Usage:
     python -m scripts.import_all_domains
 """
+import logging
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date
+from typing import Optional, Tuple
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,90 +22,62 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.config import get_settings
 from app.core.database import SessionLocal
 from app.models.tld import Tld
-from app.models.drop import DroppedDomain
-from app.services.zone_parser import extract_slds_from_zone, build_domain_name
+from app.services.drop_detector import bulk_insert_domains
+from app.services.zone_parser import iter_slds_from_zone
 
 
-def _determine_charset_type(sld: str) -> str:
-    """Determine charset type of an SLD."""
-    if sld.isalpha():
-        return "letters"
-    elif sld.isdigit():
-        return "numbers"
-    else:
-        return "mixed"
+logger = logging.getLogger("import_all_domains")
 
+# Zone files are stored as <tld>/YYYYMMDD.zone
+ZONE_FILE_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})\.zone$")
 
-def import_domains_from_zone(db: Session, tld_obj: Tld, zone_path: Path, zone_date: date):
+# Zone parsing is CPU-bound, so TLDs are imported in separate processes,
+# each writing through its own connection
+MAX_TLD_WORKERS = 4
+
+
+def configure_worker_logging():
+    """
+    Send worker output through logging on stderr.
+    
+    Each record is one write, so lines from parallel workers don't split
+    each other, and nothing sits in a child's block-buffered stdout.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+
+
+def import_domains_from_zone(db: Session, tld_obj: Tld, zone_path: Path, zone_date: date) -> Optional[int]:
     """
     Import all domains from a zone file into database.
     
+    TLD metadata is left to the caller, which writes it once per TLD.
+    
     Args:
         db: Database session
         tld_obj: TLD model instance
         zone_path: Path to zone file
         zone_date: Date of the zone file
+        
+    Returns:
+        Number of domains imported, or None if the import failed
     """
-    print(f"  📄 Parsing {zone_path.name}...")
+    logger.info(f"[.{tld_obj.name}] 📄 Parsing {zone_path.name}...")
     
     try:
-        # Parse zone file
-        slds = extract_slds_from_zone(zone_path, tld_obj.name)
-        print(f"    ✓ Found {len(slds)} SLDs")
-        
-        imported_count = 0
-        skipped_count = 0
-        
-        print(f"  💾 Importing domains...")
-        for i, sld in enumerate(sorted(slds)):
-            if (i + 1) % 1000 == 0:
-                print(f"    Processing {i + 1}/{len(slds)}...")
-            
-            domain = build_domain_name(sld, tld_obj.name)
-            
-            # Check if already exists
-            existing = db.query(DroppedDomain).filter(
-                DroppedDomain.domain == domain,
-                DroppedDomain.drop_date == zone_date
-            ).first()
-            
-            if existing:
-                skipped_count += 1
-                continue
-            
-            # Create domain record
-            dropped_domain = DroppedDomain(
-                domain=domain,
-                tld_id=tld_obj.id,
-                drop_date=zone_date,
-                length=len(sld),
-                label_count=1,
-                charset_type=_determine_charset_type(sld)
-            )
-            
-            try:
-                db.add(dropped_domain)
-                db.commit()
-                imported_count += 1
-            except IntegrityError:
-                db.rollback()
-                skipped_count += 1
-                continue
-        
-        # Update TLD metadata
-        tld_obj.last_import_date = zone_date
-        tld_obj.last_drop_count = imported_count
+        logger.info(f"[.{tld_obj.name}] 💾 Importing domains...")
+        # Stream the zone file into bulk batches, committed together
+        imported_count, skipped_count = bulk_insert_domains(
+            db, tld_obj, zone_date, iter_slds_from_zone(zone_path, tld_obj.name)
+        )
         db.commit()
         
-        print(f"    ✅ Imported: {imported_count}, Skipped: {skipped_count}")
+        logger.info(f"[.{tld_obj.name}]   ✅ Imported: {imported_count}, Skipped: {skipped_count}")
         return imported_count
         
     except Exception as e:
-        print(f"    ❌ Error: {e}")
+        logger.exception(f"[.{tld_obj.name}]   ❌ Error: {e}")
         db.rollback()
-        import traceback
-        traceback.print_exc()
-        return 0
+        return None
 
 
 def get_all_zone_files():
@@ -114,27 +91,30 @@ def get_all_zone_files():
     
     tld_zones = {}
     
-    for tld_dir in zones_dir.iterdir():
-        if tld_dir.is_dir():
-            tld_name = tld_dir.name.lower()
-            zone_files = sorted(tld_dir.glob("*.zone"))
+    # scandir reports each entry's type with the listing, so walking the
+    # zone directories costs no stat() per file as iterdir()/glob() do
+    for tld_entry in os.scandir(zones_dir):
+        if tld_entry.is_dir():
+            tld_name = tld_entry.name.lower()
             
-            for zone_file in zone_files:
+            for entry in os.scandir(tld_entry.path):
                 # Extract date from filename (YYYYMMDD.zone)
+                match = ZONE_FILE_RE.match(entry.name)
+                if match is None:
+                    if entry.name.endswith(".zone"):
+                        print(f"⚠️  Skipping invalid zone file: {entry.name}")
+                    continue
+                
                 try:
-                    date_str = zone_file.stem
-                    file_date = date(
-                        int(date_str[:4]),
-                        int(date_str[4:6]),
-                        int(date_str[6:8])
-                    )
-                    
-                    if tld_name not in tld_zones:
-                        tld_zones[tld_name] = []
-                    tld_zones[tld_name].append((file_date, zone_file))
-                except (ValueError, IndexError) as e:
-                    print(f"⚠️  Skipping invalid zone file: {zone_file.name} ({e})")
+                    file_date = date(int(match[1]), int(match[2]), int(match[3]))
+                except ValueError as e:
+                    print(f"⚠️  Skipping invalid zone file: {entry.name} ({e})")
                     continue
+                tld_zones.setdefault(tld_name, []).append((file_date, Path(entry.path)))
+            
+            # scandir order is arbitrary; import oldest first
+            if tld_name in tld_zones:
+                tld_zones[tld_name].sort(key=lambda x: x[0])
     
     return tld_zones
 
@@ -150,13 +130,57 @@ def ensure_tld_exists(db: Session, tld_name: str) -> Tld:
             is_active=True
         )
         db.add(tld)
+        # The INSERT already hands back the new id, and these sessions don't
+        # expire on commit, so no refresh SELECT is needed
         db.commit()
-        db.refresh(tld)
-        print(f"  ✓ Created TLD: {tld_name}")
+        logger.info(f"[.{tld_name}] ✓ Created TLD")
     
     return tld
 
 
+def import_tld_worker(tld_name: str, zone_files: list) -> Tuple[str, int]:
+    """
+    Import all zone files for one TLD in a worker process with its own session.
+    
+    Args:
+        tld_name: TLD name
+        zone_files: List of (date, path) tuples
+        
+    Returns:
+        Tuple of (tld_name, imported count), with -1 if the TLD failed
+    """
+    logger.info(f"[.{tld_name}] 🌐 Processing TLD")
+    # Each zone file commits; keep the TLD loaded across those commits
+    # instead of re-selecting it for every file
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        tld_obj = ensure_tld_exists(db, tld_name)
+        
+        imported = 0
+        last_import = None
+        for zone_date, zone_path in zone_files:
+            count = import_domains_from_zone(db, tld_obj, zone_path, zone_date)
+            if count is not None:
+                imported += count
+                last_import = (zone_date, count)
+        
+        # Metadata reflects the last zone file imported; written once so the
+        # zone-file loop never touches the tlds row
+        if last_import is not None:
+            db.execute(update(Tld).where(Tld.id == tld_obj.id).values(
+                last_import_date=last_import[0],
+                last_drop_count=last_import[1]
+            ))
+            db.commit()
+        return tld_name, imported
+    except Exception as e:
+        logger.exception(f"[.{tld_name}] ❌ Error: {e}")
+        db.rollback()
+        return tld_name, -1
+    finally:
+        db.close()
+
+
 def main():
     """Main execution function."""
     print("=" * 70)
@@ -180,17 +204,23 @@ def main():
     print("Importing domains from zone files...")
     print("-" * 70)
     
-    db = SessionLocal()
     try:
-        total_imported = 0
+        # TLDs are independent; the parent never opens a connection, so
+        # forked workers don't inherit pooled ones
+        tld_names = sorted(tld_zones)
+        max_workers = min(MAX_TLD_WORKERS, len(tld_names))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_worker_logging) as executor:
+            results = list(executor.map(
+                import_tld_worker,
+                tld_names,
+                [tld_zones[tld_name] for tld_name in tld_names]
+            ))
         
-        for tld_name, zone_files in sorted(tld_zones.items()):
-            print(f"\n🌐 Processing TLD: .{tld_name}")
-            tld_obj = ensure_tld_exists(db, tld_name)
-            
-            for zone_date, zone_path in zone_files:
-                imported = import_domains_from_zone(db, tld_obj, zone_path, zone_date)
-                total_imported += imported
+        print("\n" + "-" * 70)
+        for tld_name, imported in results:
+            status = "failed" if imported < 0 else f"{imported} domains"
+            print(f"  .{tld_name}: {status}")
+        total_imported = sum(imported for _, imported in results if imported > 0)
         
         print("\n" + "=" * 70)
         print(f"✅ Import complete! Total domains imported: {total_imported}")
@@ -200,9 +230,6 @@ def main():
         print(f"\n❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
-        db.rollback()
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
@@ -5,10 +5,15 @@ This script processes all zone files found in data/zones/ and compares consecuti
 Usage:
     python -m scripts.process_all_zones
 """
+import logging
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date, timedelta
 from collections import defaultdict
+from typing import Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,13 +21,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.config import get_settings
 from app.core.database import SessionLocal
 from app.models.tld import Tld
-from app.services.zone_parser import extract_slds_from_zone
 from app.services.drop_detector import (
-    compute_dropped_slds,
+    diff_zone_files,
+    diff_zone_sequence,
     persist_drops
 )
 
 
+logger = logging.getLogger("process_all_zones")
+
+# Zone files are stored as <tld>/YYYYMMDD.zone
+ZONE_FILE_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})\.zone$")
+
+# Zone parsing and diffing are CPU-bound, so TLDs run in separate processes;
+# each holds two parsed zones in memory, which is what caps the pool size
+MAX_TLD_WORKERS = 4
+
+
+def configure_worker_logging():
+    """
+    Send worker output through logging on stderr.
+    
+    Each record is one write, so lines from parallel workers don't split
+    each other, and nothing sits in a child's block-buffered stdout.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+
+
 def get_all_zone_files():
     """
     Scan data/zones/ directory and return all zone files grouped by TLD.
@@ -39,24 +64,26 @@ def get_all_zone_files():
     
     tld_zones = defaultdict(list)
     
-    for tld_dir in zones_dir.iterdir():
-        if tld_dir.is_dir():
-            tld_name = tld_dir.name.lower()
-            zone_files = sorted(tld_dir.glob("*.zone"))
+    # scandir reports each entry's type with the listing, so walking the
+    # zone directories costs no stat() per file as iterdir()/glob() do
+    for tld_entry in os.scandir(zones_dir):
+        if tld_entry.is_dir():
+            tld_name = tld_entry.name.lower()
             
-            for zone_file in zone_files:
+            for entry in os.scandir(tld_entry.path):
                 # Extract date from filename (YYYYMMDD.zone)
+                match = ZONE_FILE_RE.match(entry.name)
+                if match is None:
+                    if entry.name.endswith(".zone"):
+                        print(f"⚠️  Skipping invalid zone file: {entry.name}")
+                    continue
+                
                 try:
-                    date_str = zone_file.stem
-                    file_date = date(
-                        int(date_str[:4]),
-                        int(date_str[4:6]),
-                        int(date_str[6:8])
-                    )
-                    tld_zones[tld_name].append((file_date, zone_file))
-                except (ValueError, IndexError) as e:
-                    print(f"⚠️  Skipping invalid zone file: {zone_file.name} ({e})")
+                    file_date = date(int(match[1]), int(match[2]), int(match[3]))
+                except ValueError as e:
+                    print(f"⚠️  Skipping invalid zone file: {entry.name} ({e})")
                     continue
+                tld_zones[tld_name].append((file_date, Path(entry.path)))
             
             # Sort by date
             tld_zones[tld_name].sort(key=lambda x: x[0])
@@ -84,9 +111,10 @@ def ensure_tld_exists(db, tld_name: str) -> Tld:
             is_active=True
         )
         db.add(tld)
+        # The INSERT already hands back the new id, and these sessions don't
+        # expire on commit, so no refresh SELECT is needed
         db.commit()
-        db.refresh(tld)
-        print(f"  ✓ Created TLD: {tld_name}")
+        logger.info(f"[.{tld_name}] ✓ Created TLD")
     
     return tld
 
@@ -99,60 +127,93 @@ def process_tld_zones(db, tld_name: str, zone_files: list):
         db: Database session
         tld_name: TLD name
         zone_files: List of (date, path) tuples, sorted by date
+        
+    Returns:
+        Number of drops persisted
     """
     if len(zone_files) < 2:
-        print(f"  ⚠️  Need at least 2 zone files to detect drops. Found {len(zone_files)}")
-        return
+        logger.warning(f"[.{tld_name}] ⚠️  Need at least 2 zone files to detect drops. Found {len(zone_files)}")
+        return 0
     
     tld_obj = ensure_tld_exists(db, tld_name)
     
     total_drops = 0
     total_persisted = 0
     
-    # Process consecutive pairs
+    # Each zone file is parsed once for all consecutive pairs; only hashes
+    # of the zones are held, drops come back as strings
+    logger.info(f"[.{tld_name}] Diffing {len(zone_files)} zone files...")
+    try:
+        pair_drops = diff_zone_sequence([zone_path for _, zone_path in zone_files], tld_name)
+    except Exception as e:
+        # One unreadable file would fail the whole run; diff pair by pair
+        # instead so only the pairs touching it are skipped
+        logger.exception(f"[.{tld_name}] ⚠️  Sequence diff failed, diffing pairs one by one: {e}")
+        pair_drops = None
+    
+    # Persist oldest pair first so the TLD metadata ends on the latest one
     for i in range(len(zone_files) - 1):
         prev_date, prev_path = zone_files[i]
         curr_date, curr_path = zone_files[i + 1]
         
-        print(f"\n  📅 Comparing {prev_date.isoformat()} → {curr_date.isoformat()}")
+        logger.info(f"[.{tld_name}] 📅 Comparing {prev_date.isoformat()} → {curr_date.isoformat()}")
         
         try:
-            # Parse both zone files
-            print(f"    Parsing {prev_path.name}...")
-            prev_slds = extract_slds_from_zone(prev_path, tld_name)
-            print(f"      ✓ Found {len(prev_slds)} SLDs")
-            
-            print(f"    Parsing {curr_path.name}...")
-            curr_slds = extract_slds_from_zone(curr_path, tld_name)
-            print(f"      ✓ Found {len(curr_slds)} SLDs")
-            
-            # Compute drops (domains that were in prev but not in curr)
-            dropped_slds = compute_dropped_slds(prev_slds, curr_slds)
-            print(f"    🎯 Detected {len(dropped_slds)} dropped domains")
+            if pair_drops is not None:
+                dropped_slds, curr_count = pair_drops[i]
+            else:
+                dropped_slds, curr_count = diff_zone_files(prev_path, curr_path, tld_name)
+            logger.info(f"[.{tld_name}]   ✓ Current zone has {curr_count} SLDs")
+            logger.info(f"[.{tld_name}]   🎯 Detected {len(dropped_slds)} dropped domains")
             
             if dropped_slds:
                 # Persist to database
                 persisted = persist_drops(db, tld_obj, prev_date, dropped_slds)
                 total_persisted += persisted
                 total_drops += len(dropped_slds)
-                print(f"    ✓ Persisted {persisted} domains to database")
+                logger.info(f"[.{tld_name}]   ✓ Persisted {persisted} domains to database")
             else:
                 # Update TLD metadata even if no drops
                 tld_obj.last_import_date = prev_date
                 tld_obj.last_drop_count = 0
                 db.commit()
-                print(f"    ✓ No drops (updated metadata)")
+                logger.info(f"[.{tld_name}]   ✓ No drops (updated metadata)")
                 
         except Exception as e:
-            print(f"    ❌ Error processing: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[.{tld_name}]   ❌ Error processing: {e}")
             db.rollback()
             continue
     
-    print(f"\n  📊 Summary for .{tld_name}:")
-    print(f"    Total drops detected: {total_drops}")
-    print(f"    Total persisted: {total_persisted}")
+    logger.info(
+        f"[.{tld_name}] 📊 Total drops detected: {total_drops}, total persisted: {total_persisted}"
+    )
+    
+    return total_persisted
+
+
+def process_tld_worker(tld_name: str, zone_files: list) -> Tuple[str, int]:
+    """
+    Process one TLD's zone files in a worker process with its own session.
+    
+    Args:
+        tld_name: TLD name
+        zone_files: List of (date, path) tuples, sorted by date
+        
+    Returns:
+        Tuple of (tld_name, persisted count), with -1 if the TLD failed
+    """
+    logger.info(f"[.{tld_name}] 🌐 Processing TLD")
+    # Each zone pair commits; keep the TLD loaded across those commits
+    # instead of re-selecting it for every pair
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        return tld_name, process_tld_zones(db, tld_name, zone_files)
+    except Exception as e:
+        logger.exception(f"[.{tld_name}] ❌ Error: {e}")
+        db.rollback()
+        return tld_name, -1
+    finally:
+        db.close()
 
 
 def main():
@@ -178,11 +239,22 @@ def main():
     print("Processing zone files and detecting drops...")
     print("-" * 70)
     
-    db = SessionLocal()
     try:
-        for tld_name, zone_files in sorted(tld_zones.items()):
-            print(f"\n🌐 Processing TLD: .{tld_name}")
-            process_tld_zones(db, tld_name, zone_files)
+        # TLDs are independent; the parent never opens a connection, so
+        # forked workers don't inherit pooled ones
+        tld_names = sorted(tld_zones)
+        max_workers = min(MAX_TLD_WORKERS, len(tld_names))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_worker_logging) as executor:
+            results = list(executor.map(
+                process_tld_worker,
+                tld_names,
+                [tld_zones[tld_name] for tld_name in tld_names]
+            ))
+        
+        print("\n" + "-" * 70)
+        for tld_name, persisted in results:
+            status = "failed" if persisted < 0 else f"{persisted} drops"
+            print(f"  .{tld_name}: {status}")
         
         print("\n" + "=" * 70)
         print("✅ Processing complete!")
@@ -192,9 +264,6 @@ def main():
         print(f"\n❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
-        db.rollback()
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
@@ -4,24 +4,16 @@ Quick script to import all domains from zone files into database.
 import sys
 from pathlib import Path
 from datetime import date
-from sqlalchemy.exc import IntegrityError
+
+from sqlalchemy import update
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import get_settings
 from app.core.database import SessionLocal
 from app.models.tld import Tld
-from app.models.drop import DroppedDomain
-from app.services.zone_parser import extract_slds_from_zone, build_domain_name
-
-
-def _determine_charset_type(sld: str) -> str:
-    if sld.isalpha():
-        return "letters"
-    elif sld.isdigit():
-        return "numbers"
-    else:
-        return "mixed"
+from app.services.drop_detector import bulk_insert_domains
+from app.services.zone_parser import iter_slds_from_zone
 
 
 def main():
@@ -32,7 +24,9 @@ def main():
         print(f"❌ Zones directory not found: {zones_dir}")
         return
     
-    db = SessionLocal()
+    # Each zone file commits; keep the TLD loaded across those commits
+    # instead of re-selecting it for every file
+    db = SessionLocal(expire_on_commit=False)
     total_imported = 0
     
     try:
@@ -54,11 +48,13 @@ def main():
             if not tld_obj:
                 tld_obj = Tld(name=tld_name, display_name=tld_name, is_active=True)
                 db.add(tld_obj)
+                # The INSERT already hands back the new id, and these sessions don't
+                # expire on commit, so no refresh SELECT is needed
                 db.commit()
-                db.refresh(tld_obj)
                 print(f"  ✓ Created TLD")
             
             # Process each zone file
+            last_import = None
             for zone_file in zone_files:
                 try:
                     # Extract date
@@ -67,61 +63,30 @@ def main():
                     
                     print(f"  📄 {zone_file.name} ({file_date.isoformat()})...")
                     
-                    # Parse zone file
-                    slds = extract_slds_from_zone(zone_file, tld_name)
-                    print(f"    ✓ Found {len(slds)} SLDs")
-                    
-                    # Import domains
-                    imported = 0
-                    skipped = 0
-                    
-                    for i, sld in enumerate(sorted(slds)):
-                        if (i + 1) % 5000 == 0:
-                            print(f"    Processing {i + 1}/{len(slds)}...")
-                        
-                        domain = build_domain_name(sld, tld_name)
-                        
-                        # Check if exists
-                        exists = db.query(DroppedDomain).filter(
-                            DroppedDomain.domain == domain,
-                            DroppedDomain.drop_date == file_date
-                        ).first()
-                        
-                        if exists:
-                            skipped += 1
-                            continue
-                        
-                        # Create record
-                        dropped_domain = DroppedDomain(
-                            domain=domain,
-                            tld_id=tld_obj.id,
-                            drop_date=file_date,
-                            length=len(sld),
-                            label_count=1,
-                            charset_type=_determine_charset_type(sld)
-                        )
-                        
-                        try:
-                            db.add(dropped_domain)
-                            db.commit()
-                            imported += 1
-                        except IntegrityError:
-                            db.rollback()
-                            skipped += 1
-                    
-                    # Update TLD metadata
-                    tld_obj.last_import_date = file_date
-                    tld_obj.last_drop_count = imported
+                    # Stream the zone file into bulk batches, committed once below
+                    imported, skipped = bulk_insert_domains(
+                        db, tld_obj, file_date, iter_slds_from_zone(zone_file, tld_name)
+                    )
                     db.commit()
                     
                     print(f"    ✅ Imported: {imported}, Skipped: {skipped}")
                     total_imported += imported
+                    last_import = (file_date, imported)
                     
                 except Exception as e:
                     print(f"    ❌ Error: {e}")
                     db.rollback()
                     import traceback
                     traceback.print_exc()
+            
+            # Metadata reflects the last zone file imported; written once per
+            # TLD so the zone-file loop never touches the tlds row
+            if last_import is not None:
+                db.execute(update(Tld).where(Tld.id == tld_obj.id).values(
+                    last_import_date=last_import[0],
+                    last_drop_count=last_import[1]
+                ))
+                db.commit()
         
         print(f"\n✅ Total imported: {total_imported}")
         
@@ -0,0 +1,59 @@
+"""
+Test script for /domains pagination past the last page
+"""
+import re
+import sys
+import urllib.request
+
+BASE_URL = 'http://localhost:8047/domains'
+TOTAL_RE = re.compile(r'of <span class="text-frost font-semibold">(\d+)(\+?)</span> domains')
+
+
+def fetch(query):
+    req = urllib.request.Request(f'{BASE_URL}?{query}')
+    req.add_header('User-Agent', 'Mozilla/5.0')
+    with urllib.request.urlopen(req, timeout=30) as response:
+        return response.status, response.read().decode('utf-8', errors='ignore')
+
+
+try:
+    print("1. First page...")
+    status, content = fetch('page=1&page_size=30')
+    print(f"✅ Status: {status}")
+    first = TOTAL_RE.search(content)
+    if not first:
+        print("⚠️  No dropped domains listed, nothing to paginate")
+        sys.exit(0)
+
+    print("\n2. Exact total...")
+    status, content = fetch('page=1&page_size=30&exact_count=true')
+    exact = TOTAL_RE.search(content)
+    exact_total = int(exact.group(1))
+    last_page = max(1, (exact_total + 29) // 30)
+    print(f"✅ {exact_total} domains, last page {last_page}")
+
+    print("\n3. Out-of-range page...")
+    status, content = fetch('page=99999&page_size=30')
+    print(f"✅ Status: {status}")
+    out_of_range = TOTAL_RE.search(content)
+    if not out_of_range:
+        print("❌ Out-of-range page rendered no rows")
+        sys.exit(1)
+    if int(out_of_range.group(1)) != exact_total or out_of_range.group(2):
+        print(f"❌ Out-of-range page reports {out_of_range.group(1)}{out_of_range.group(2)} domains, expected {exact_total}")
+        sys.exit(1)
+    if f'text-void font-semibold">{last_page}</span>' not in content and last_page > 1:
+        print(f"❌ Out-of-range page was not clamped to page {last_page}")
+        sys.exit(1)
+    print(f"✅ Clamped to page {last_page} of {exact_total} domains")
+
+    print("\n✅ Tüm testler başarılı!")
+
+except urllib.error.URLError as e:
+    print(f"❌ Connection error: {e}")
+    sys.exit(1)
+except Exception as e:
+    print(f"❌ Error: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)